@@ -28,9 +28,16 @@ pyinstaller ^
     --icon=ico/flips.ico ^
     --add-data "ico;ico" ^
     --add-data "flips;flips" ^
+    --hidden-import _hashlib ^
     --name "FlipsAutoPatcher-v2.3.1" ^
     main.py
 
+REM ==== Post-build check: OpenSSL must be bundled for fast MD5/SHA-1 ====
+dir /s /b "dist\FlipsAutoPatcher-v2.3.1\libcrypto-*.dll" >nul 2>&1
+if errorlevel 1 (
+    echo WARNING: No libcrypto DLL in the build; MD5/SHA-1 will use the slower built-in hashlib.
+)
+
 echo.
 echo Build complete!
 pause
@@ -23,16 +23,17 @@ from __future__ import annotations
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 import endian_swap as rom_byteswap
 from utils import (
     calculate_crc32,
-    calculate_md5,
-    calculate_sha1,
-    calculate_zle_hash,
+    calculate_all_hashes,
     get_patch_metadata,
+    get_patch_footer,
     get_ips_requirements,
+    get_ips_details,
     get_ips_metadata,
     validate_ips_base_rom,
     log_operation_paths,
@@ -47,11 +48,18 @@ from utils import (
     get_known_header_info,
     can_add_snes_copier_header,
     get_rom_family_display,
+    iter_files_with_extensions,
+    ROM_SEARCH_EXTENSIONS,
+    run_flips,
+    flips_output_text,
 )
 
 
 from typing import Callable, Optional
 
+# Upper bound on concurrent flips.exe runs during Bulk Patching.
+_BULK_MAX_WORKERS = 8
+
 
 # ----------------------------
 # Bulk post-processing helpers
@@ -86,13 +94,40 @@ def _bulk_get_byteswap_mode(app) -> str:
     return "disable"
 
 
-def _bulk_apply_byteswap_to_output(app, patched_rom_path: str, log: Callable[[str], None]) -> str:
+def _bulk_read_output_options(app) -> dict:
+    """Snapshot the GUI's output options once per bulk run.
+
+    Tk variables must only be read on the Tk thread, so the pool workers get
+    this plain dict instead of the app.
+    """
+    def _flag(*names: str) -> bool:
+        for name in names:
+            try:
+                return bool(getattr(app, name).get())
+            except Exception:
+                continue
+        return False
+
+    return {
+        "byteswap_mode": _bulk_get_byteswap_mode(app),
+        # `trim_enabled` is the legacy var name.
+        "trim_64mb": _flag("trim_64mb", "trim_enabled"),
+        "temp_remove_ines_header": _flag("temp_remove_ines_header"),
+        "temp_remove_snes_header": _flag("temp_remove_snes_header"),
+        "add_ines_header": _flag("add_ines_header"),
+        "remove_ines_header": _flag("remove_ines_header"),
+        "add_snes_header": _flag("add_snes_header"),
+        "remove_snes_header": _flag("remove_snes_header"),
+    }
+
+
+def _bulk_apply_byteswap_to_output(options: dict, patched_rom_path: str, log: Callable[[str], None]) -> str:
     """Convert patched N64 ROM to selected endian and rename extension accordingly.
 
     This replicates the intended behavior of main.py's _apply_byteswap_to_output
     even if that method is incomplete in the user's local main.py.
     """
-    mode = _bulk_get_byteswap_mode(app)
+    mode = options["byteswap_mode"]
     if mode == "disable":
         return patched_rom_path
 
@@ -153,18 +188,9 @@ def _bulk_apply_byteswap_to_output(app, patched_rom_path: str, log: Callable[[st
         return patched_rom_path
 
 
-def _bulk_apply_trim_to_64mb_output(app, patched_rom_path: str, log: Callable[[str], None]) -> str:
+def _bulk_apply_trim_to_64mb_output(options: dict, patched_rom_path: str, log: Callable[[str], None]) -> str:
     """Optionally trim the patched output ROM to 64MiB (N64 only)."""
-    try:
-        enabled = bool(app.trim_64mb.get())
-    except Exception:
-        # Fallback: legacy var name
-        try:
-            enabled = bool(app.trim_enabled.get())
-        except Exception:
-            enabled = False
-
-    if not enabled:
+    if not options["trim_64mb"]:
         return patched_rom_path
 
     ext = os.path.splitext(patched_rom_path)[1].lower()
@@ -183,7 +209,7 @@ def _bulk_apply_trim_to_64mb_output(app, patched_rom_path: str, log: Callable[[s
     return patched_rom_path
 
 
-def _bulk_prepare_patch_io_context(app, patch_file_path: str, base_rom_path: str, final_output_path: str, log: Callable[[str], None]) -> dict:
+def _bulk_prepare_patch_io_context(options: dict, patch_file_path: str, base_rom_path: str, final_output_path: str, log: Callable[[str], None]) -> dict:
     """Prepare temporary input/output files for ROM Header Options automate modes.
 
     Rules:
@@ -209,14 +235,8 @@ def _bulk_prepare_patch_io_context(app, patch_file_path: str, base_rom_path: str
     suffix = os.path.splitext(base_rom_path)[1]
     base_ext = normalize_rom_extension(base_rom_path)
 
-    try:
-        temp_remove_ines = bool(app.temp_remove_ines_header.get())
-    except Exception:
-        temp_remove_ines = False
-    try:
-        temp_remove_snes = bool(app.temp_remove_snes_header.get())
-    except Exception:
-        temp_remove_snes = False
+    temp_remove_ines = options["temp_remove_ines_header"]
+    temp_remove_snes = options["temp_remove_snes_header"]
 
     if temp_remove_ines and base_ext == "nes":
         log(f"ROM header options: Checking Base ROM for temporary iNES header removal before applying {patch_name}.")
@@ -284,13 +304,13 @@ def _bulk_finalize_patch_output(context: dict, final_output_path: str, log: Call
         f.write(patched_data)
     return final_output_path
 
-def _bulk_apply_output_header_options(app, patched_rom_path: str, base_rom_path: str, context: dict, log: Callable[[str], None]) -> str:
+def _bulk_apply_output_header_options(options: dict, patched_rom_path: str, base_rom_path: str, context: dict, log: Callable[[str], None]) -> str:
     base_ext = normalize_rom_extension(base_rom_path)
     output_name = os.path.basename(patched_rom_path)
 
     if base_ext == "nes":
-        add_out = bool(app.temp_remove_ines_header.get() or app.add_ines_header.get())
-        remove_out = bool(app.remove_ines_header.get())
+        add_out = options["temp_remove_ines_header"] or options["add_ines_header"]
+        remove_out = options["remove_ines_header"]
         if add_out and remove_out:
             log(f"Conflicting NES output options; leaving output unchanged: {output_name}")
             return patched_rom_path
@@ -318,8 +338,8 @@ def _bulk_apply_output_header_options(app, patched_rom_path: str, base_rom_path:
                 log(f"Failed to add iNES copier header to output: {e}")
 
     elif base_ext in {"sfc", "smc", "swc", "fig"}:
-        add_out = bool(app.temp_remove_snes_header.get() or app.add_snes_header.get())
-        remove_out = bool(app.remove_snes_header.get())
+        add_out = options["temp_remove_snes_header"] or options["add_snes_header"]
+        remove_out = options["remove_snes_header"]
         if add_out and remove_out:
             log(f"Conflicting SNES output options; leaving output unchanged: {output_name}")
             return patched_rom_path
@@ -349,13 +369,13 @@ def _bulk_apply_output_header_options(app, patched_rom_path: str, base_rom_path:
     return patched_rom_path
 
 
-def _bulk_postprocess(app, patched_rom_path: str, base_rom_path: str, log: Callable[[str], None]) -> str:
+def _bulk_postprocess(options: dict, patched_rom_path: str, base_rom_path: str, log: Callable[[str], None]) -> str:
     """_bulk_postprocess helper.
 
     Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
     """
-    patched_rom_path = _bulk_apply_byteswap_to_output(app, patched_rom_path, log)
-    patched_rom_path = _bulk_apply_trim_to_64mb_output(app, patched_rom_path, log)
+    patched_rom_path = _bulk_apply_byteswap_to_output(options, patched_rom_path, log)
+    patched_rom_path = _bulk_apply_trim_to_64mb_output(options, patched_rom_path, log)
     return patched_rom_path
 
 
@@ -495,6 +515,8 @@ def _bulk_predict_final_output_path(app, output_dir: str, patch_file_path: str,
 def _bulk_log_emulator_launch_summary(app, runnable_patches, compatibility_info, baseroms, output_dir, append_suffix, log) -> None:
     """Log how many ROMs are expected to launch in each emulator."""
     launch_counts: Dict[str, int] = {}
+    # Base ROM CRC32 text by path, so each base is hashed at most once here.
+    candidate_crcs: Dict[str, str] = {}
 
     for patch_file_path in runnable_patches:
         ext = os.path.splitext(patch_file_path)[1].lower()
@@ -502,13 +524,16 @@ def _bulk_log_emulator_launch_summary(app, runnable_patches, compatibility_info,
 
         if ext == ".bps":
             patch_info = compatibility_info.get(patch_file_path, {})
-            metadata = patch_info.get("metadata") or get_patch_metadata(patch_file_path) or {}
-            src_crc = str(metadata.get("Source CRC32", "")).lower()
+            src_crc = patch_info.get("source_crc")
+            if src_crc is None:
+                src_crc = str((get_patch_footer(patch_file_path) or {}).get("Source CRC32", "")).lower()
             chosen_base = patch_info.get("chosen_base")
             if not chosen_base and src_crc:
                 for candidate in baseroms:
                     try:
-                        if f"{calculate_crc32(candidate):#010x}".lower() == src_crc:
+                        if candidate not in candidate_crcs:
+                            candidate_crcs[candidate] = f"{calculate_crc32(candidate):#010x}".lower()
+                        if candidate_crcs[candidate] == src_crc:
                             chosen_base = candidate
                             break
                     except Exception:
@@ -555,24 +580,24 @@ def _bulk_log_emulator_launch_summary(app, runnable_patches, compatibility_info,
     log("--------------------------------")
 
 
-def _log_utils_hashes(log, file_path: str, label: str) -> None:
+def _log_utils_hashes(log, file_path: str, label: str) -> Optional[dict]:
     """Log hash info using utils.py helpers (CRC32 / MD5 / SHA-1 / ZLE).
 
     Bulk mode should rely on utils.py for hash logic, and should also display
     the same verification info users see in the normal (non-bulk) workflow.
+    Returns the hashes so callers can reuse the CRC32 instead of re-reading the file.
     """
     try:
-        crc32 = calculate_crc32(file_path)
-        md5 = calculate_md5(file_path)
-        sha1 = calculate_sha1(file_path)
-        zle = calculate_zle_hash(file_path)
+        hashes = calculate_all_hashes(file_path)
         log(f"{label} Hashes ({os.path.basename(file_path)}):")
-        log(format_log_field("CRC32", f"{crc32:#010x}"))
-        log(format_log_field("MD5", md5))
-        log(format_log_field("SHA-1", sha1))
-        log(format_log_field("ZLE", zle))
+        log(format_log_field("CRC32", f"{hashes['crc32']:#010x}"))
+        log(format_log_field("MD5", hashes['md5']))
+        log(format_log_field("SHA-1", hashes['sha1']))
+        log(format_log_field("ZLE", hashes['zle']))
+        return hashes
     except Exception as e:
         log(f"{label} hash display error for {os.path.basename(file_path)}: {e}")
+        return None
 
 
 
@@ -701,36 +726,11 @@ def collect_patches(patch_files_dir: str, log, *, recursive: bool = False, inclu
     is enabled.
     """
     out: List[str] = []
-    seen = set()
-
-    def _maybe_add(full_path: str) -> None:
-        """_maybe_add helper.
-
-        Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-        """
-        try:
-            if not os.path.isfile(full_path):
-                return
-            ext = os.path.splitext(full_path)[1].lower()
-            allowed_patch_exts = {".bps"} | ({".ips"} if include_ips else set())
-            if ext not in allowed_patch_exts:
-                return
-            ap = os.path.abspath(full_path)
-            if ap in seen:
-                return
-            seen.add(ap)
-            out.append(ap)
-        except Exception:
-            return
+    allowed_patch_exts = {"bps", "ips"} if include_ips else {"bps"}
 
     try:
-        if recursive:
-            for root, _, files in os.walk(patch_files_dir):
-                for name in files:
-                    _maybe_add(os.path.join(root, name))
-        else:
-            for name in os.listdir(patch_files_dir):
-                _maybe_add(os.path.join(patch_files_dir, name))
+        patch_root = os.path.abspath(patch_files_dir)
+        out.extend(iter_files_with_extensions(patch_root, allowed_patch_exts, recurse=recursive))
     except Exception as e:
         try:
             log(f"Bulk Patching - patch scan error: {e}")
@@ -747,44 +747,18 @@ def collect_baseroms(base_roms_dir: str, log, *, recursive: bool = False) -> Lis
     scope continues to scan only the top-level base roms folder.
     """
     out: List[str] = []
-    seen = set()
 
     try:
-        allowed = set(getattr(rom_byteswap, "FILE_EXTENSIONS", set()))
+        allowed = {ext.lstrip(".") for ext in getattr(rom_byteswap, "FILE_EXTENSIONS", set())}
     except Exception:
         allowed = set()
-
-    def _maybe_add(full_path: str) -> None:
-        """_maybe_add helper.
-
-        Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-        """
-        try:
-            if not os.path.isfile(full_path):
-                return
-            ext = os.path.splitext(full_path)[1].lower()
-            if ext in {".bps", ".ips"}:
-                return
-            if ext in {".json", ".txt"}:
-                return
-            if allowed and ext not in allowed:
-                return
-            ap = os.path.abspath(full_path)
-            if ap in seen:
-                return
-            seen.add(ap)
-            out.append(ap)
-        except Exception:
-            return
+    allowed -= {"bps", "ips", "json", "txt"}
+    if not allowed:
+        allowed = set(ROM_SEARCH_EXTENSIONS)
 
     try:
-        if recursive:
-            for root, _, files in os.walk(base_roms_dir):
-                for name in files:
-                    _maybe_add(os.path.join(root, name))
-        else:
-            for name in os.listdir(base_roms_dir):
-                _maybe_add(os.path.join(base_roms_dir, name))
+        rom_root = os.path.abspath(base_roms_dir)
+        out.extend(iter_files_with_extensions(rom_root, allowed, recurse=recursive))
     except Exception as e:
         try:
             log(f"Bulk Patching - base ROM scan error: {e}")
@@ -808,20 +782,24 @@ def prevalidate_bulk_patches(patch_list: List[str], baseroms: List[str], crc_to_
         patch_info = {'ext': ext}
 
         if ext == '.bps':
-            metadata = get_patch_metadata(patch_file_path) or {}
-            src_crc = str(metadata.get('Source CRC32', '')).lower()
+            # Gate on the footer CRC32 only; the full MD5/SHA-1 pass for the
+            # displayed hashes runs later, and only for patches that will run.
+            footer = get_patch_footer(patch_file_path) or {}
+            src_crc = str(footer.get('Source CRC32', '')).lower()
             chosen_base = crc_to_base.get(src_crc)
             if chosen_base or force_patch:
-                patch_info.update({'metadata': metadata, 'chosen_base': chosen_base, 'source_crc': src_crc})
+                patch_info.update({'chosen_base': chosen_base, 'source_crc': src_crc})
                 runnable.append(patch_file_path)
                 info[patch_file_path] = patch_info
             continue
 
         if ext == '.ips':
-            min_size, trunc_size, record_count = get_ips_requirements(patch_file_path)
+            # Parse the IPS records once and check every base ROM against that parse.
+            ips_details = get_ips_details(patch_file_path)
+            min_size, trunc_size, record_count = get_ips_requirements(patch_file_path, ips_details)
             validated_candidates = []
             for candidate in baseroms:
-                ok, reason, details = validate_ips_base_rom(patch_file_path, candidate)
+                ok, reason, details = validate_ips_base_rom(patch_file_path, candidate, ips_details)
                 if ok:
                     validated_candidates.append((details.get('rom_size', 0), candidate, details))
 
@@ -896,8 +874,8 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
     base_crc_by_path: Dict[str, str] = {}
     for base in baseroms:
         try:
-            _log_utils_hashes(log, base, label="Base ROM")
-            c = calculate_crc32(base)
+            hashes = _log_utils_hashes(log, base, label="Base ROM")
+            c = hashes['crc32'] if hashes else calculate_crc32(base)
             crc_text = f"{c:#010x}".lower()
             crc_to_base[crc_text] = base
             base_crc_by_path[base] = crc_text
@@ -917,7 +895,15 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
     except Exception as e:
         log(f"Bulk Patching: emulator launch summary error: {e}")
 
-    for patch_file_path in runnable_patches:
+    options = _bulk_read_output_options(app)
+
+    def _apply_patch(patch_file_path):
+        """Apply one bulk patch on a pool thread.
+
+        Returns (patched_rom_path, base_rom_to_remember); both are None when the
+        patch was skipped or failed. Remembering the Base ROM and launching the
+        emulator are left to the caller so they stay on the coordinating thread.
+        """
         ext = os.path.splitext(patch_file_path)[1].lower()
         log(f"Bulk Patching: Patched → {os.path.basename(patch_file_path)}")
 
@@ -926,7 +912,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
             metadata = patch_info.get("metadata") or get_patch_metadata(patch_file_path)
             if not metadata or "Source CRC32" not in metadata:
                 log("  Skipping: could not read Source CRC32 from patch metadata.")
-                continue
+                return None, None
 
             # Display patch hash/metadata info (derived from utils.py).
             try:
@@ -948,7 +934,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                     log(format_log_field("Family", family))
             if not chosen_base and not force_patch:
                 log(f"  Skipping: no matching base ROM found for Source CRC32 {src_crc}.")
-                continue
+                return None, None
             if not chosen_base and force_patch and baseroms:
                 chosen_base = baseroms[0]
 
@@ -958,28 +944,32 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                 base_ext = os.path.splitext(chosen_base)[1]
                 patch_stem = os.path.splitext(os.path.basename(patch_file_path))[0]
                 patched_rom_path = os.path.join(output_dir, (patch_stem + "_patched" + base_ext) if append_suffix else (patch_stem + base_ext))
-                context = _bulk_prepare_patch_io_context(app, patch_file_path, chosen_base, patched_rom_path, log)
+                context = _bulk_prepare_patch_io_context(options, patch_file_path, chosen_base, patched_rom_path, log)
                 input_rom_path = context['input_rom_path']
                 temp_input_rom_path = context.get('temp_input_rom_path')
                 temp_output_path = context.get('temp_output_path')
                 working_output_path = context['working_output_path']
 
                 input_crc_text = ""
-                try:
-                    input_crc_text = f"{calculate_crc32(input_rom_path):#010x}".lower()
-                except Exception:
-                    input_crc_text = base_crc_by_path.get(chosen_base, "")
+                if input_rom_path == chosen_base and chosen_base in base_crc_by_path:
+                    # Unmodified base ROM: its CRC32 was computed once above.
+                    input_crc_text = base_crc_by_path[chosen_base]
+                else:
+                    try:
+                        input_crc_text = f"{calculate_crc32(input_rom_path):#010x}".lower()
+                    except Exception:
+                        input_crc_text = base_crc_by_path.get(chosen_base, "")
 
                 if force_patch and input_crc_text != src_crc:
                     command = [flips_exe_path, "--apply", "--ignore-checksum", patch_file_path, input_rom_path, working_output_path]
                 else:
                     command = [flips_exe_path, "--apply", patch_file_path, input_rom_path, working_output_path]
 
-                subprocess.run(command, check=True, capture_output=True, text=True)
+                run_flips(command)
                 patched_rom_path = _bulk_finalize_patch_output(context, patched_rom_path, log)
 
                 try:
-                    patched_rom_path = _bulk_postprocess(app, patched_rom_path, chosen_base, log)
+                    patched_rom_path = _bulk_postprocess(options, patched_rom_path, chosen_base, log)
                 except Exception as e:
                     log(f"Post-process error: {e}")
 
@@ -989,14 +979,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                     base_rom_path=input_rom_path,
                     output_file_path=patched_rom_path
                 )
-
-                try:
-                    remember = getattr(app, "_remember_base_rom_for_patch", None)
-                    if callable(remember):
-                        remember(patch_file_path, chosen_base)
-                except Exception:
-                    pass
-                _bulk_launch_emulator_if_configured(app, patched_rom_path, log)
+                return patched_rom_path, chosen_base
 
             except subprocess.CalledProcessError as e:
                 log("  Error applying patch:")
@@ -1004,8 +987,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                     log(f"    Command: {' '.join(command)}")
                 except Exception:
                     pass
-                log(f"    Stdout: {(e.stdout or '').strip() or 'No output'}")
-                log(f"    Stderr: {(e.stderr or '').strip() or 'Unknown error occurred.'}")
+                log(f"    Output: {flips_output_text(e) or 'No output'}")
             except Exception as e:
                 log(f"  Bulk apply error: {e}")
             finally:
@@ -1027,7 +1009,6 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
             except Exception:
                 pass
 
-            applied = False
             validated_candidates = list(patch_info.get("validated_candidates", []))
 
 
@@ -1049,7 +1030,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                     base_ext = os.path.splitext(candidate)[1]
                     patch_stem = os.path.splitext(os.path.basename(patch_file_path))[0]
                     patched_rom_path = os.path.join(output_dir, (patch_stem + "_patched" + base_ext) if append_suffix else (patch_stem + base_ext))
-                    context = _bulk_prepare_patch_io_context(app, patch_file_path, candidate, patched_rom_path, log)
+                    context = _bulk_prepare_patch_io_context(options, patch_file_path, candidate, patched_rom_path, log)
                     input_rom_path = context['input_rom_path']
                     temp_input_rom_path = context.get('temp_input_rom_path')
                     temp_output_path = context.get('temp_output_path')
@@ -1060,11 +1041,11 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                     else:
                         command = [flips_exe_path, "--apply", patch_file_path, input_rom_path, working_output_path]
 
-                    subprocess.run(command, check=True, capture_output=True, text=True)
+                    run_flips(command)
                     patched_rom_path = _bulk_finalize_patch_output(context, patched_rom_path, log)
 
                     try:
-                        patched_rom_path = _bulk_postprocess(app, patched_rom_path, candidate, log)
+                        patched_rom_path = _bulk_postprocess(options, patched_rom_path, candidate, log)
                     except Exception as e:
                         log(f"Post-process error: {e}")
 
@@ -1075,10 +1056,7 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                         output_file_path=patched_rom_path,
                         header="  Applied using:",
                     )
-                    _bulk_launch_emulator_if_configured(app, patched_rom_path, log)
-
-                    applied = True
-                    break
+                    return patched_rom_path, None
 
                 except subprocess.CalledProcessError:
                     try:
@@ -1099,10 +1077,61 @@ def bulk_apply_all(app, script_dir: str, flips_exe_path: str) -> None:
                             except Exception:
                                 pass
 
-            if not applied:
-                log("  Skipping: could not apply this .ips patch to any valid base ROM in baseroms/.")
+            log("  Skipping: could not apply this .ips patch to any valid base ROM in baseroms/.")
 
         else:
             log("  Skipping: not a .bps/.ips file.")
+        return None, None
+
+    def _apply_group(group):
+        """Apply patches that share an output name in order, capturing their log lines."""
+        results = []
+        for patch_file_path in group:
+            capture = getattr(app, "_log_capture", None)
+            if capture is not None:
+                capture.lines = []
+            try:
+                try:
+                    outcome = _apply_patch(patch_file_path)
+                except Exception as e:
+                    log(f"  Bulk apply error: {e}")
+                    outcome = (None, None)
+            finally:
+                lines = []
+                if capture is not None:
+                    lines, capture.lines = capture.lines or [], None
+            results.append((patch_file_path, lines, outcome))
+        return results
+
+    # flips.exe runs are independent, so patches are applied on a small pool.
+    # Patches whose names map to the same output file stay in one group and run
+    # in order, so the last one still wins like in a sequential run.
+    groups: Dict[str, List[str]] = {}
+    for patch_file_path in runnable_patches:
+        stem = os.path.splitext(os.path.basename(patch_file_path))[0]
+        groups.setdefault(os.path.normcase(stem), []).append(patch_file_path)
+
+    log_lines = getattr(app, "log_messages", None)
+    max_workers = max(1, min(_BULK_MAX_WORKERS, os.cpu_count() or 4, len(groups)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # map() yields groups in the order their first patch appears in
+        # runnable_patches; patches sharing an output name are logged together.
+        for results in pool.map(_apply_group, groups.values()):
+            for patch_file_path, lines, (patched_rom_path, remember_base) in results:
+                if callable(log_lines):
+                    log_lines(lines)
+                else:
+                    for line in lines:
+                        log(line)
+                if not patched_rom_path:
+                    continue
+                if remember_base:
+                    try:
+                        remember = getattr(app, "_remember_base_rom_for_patch", None)
+                        if callable(remember):
+                            remember(patch_file_path, remember_base)
+                    except Exception:
+                        pass
+                _bulk_launch_emulator_if_configured(app, patched_rom_path, log)
 
     log("Bulk Patching: done.")
\ No newline at end of file
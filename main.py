@@ -25,7 +25,9 @@
          - calculate_crc32(path) → returns a short checksum (hex) used by many patches to confirm the correct Base ROM.
          - calculate_md5(path) / calculate_sha1(path) → longer fingerprints used for verification.
          - calculate_zle_hash(path) → reads a small ROM header region (bytes 16..27) and formats it as hex; shown for reference.
+         - calculate_all_hashes(path) → computes CRC32, MD5, SHA-1 and ZLE together in a single read of the file.
          - get_patch_metadata(path) → for .bps files, reads the stored Source/Target CRC32 (and also reports hashes of the patch file itself).
+         - get_patch_footer(path) → only the stored Source/Target CRC32 of a .bps file (no hashing of the patch itself).
      C7) “Open with …” helpers – moved to a separate module `open_with_handle.py`
          - update_patch_method(str)
          - display_patch_metadata(path), display_base_rom_hashes(), display_modified_rom_hashes(path)
@@ -48,12 +50,14 @@ import subprocess
 import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from threading import Thread, Lock
-import json
+from threading import Thread, Lock, Event, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 import platform
 import glob
 import time
 import tempfile
+import queue
 
 try:
     import winreg
@@ -67,7 +71,7 @@ from rom_header_options import open_rom_header_options
 
 # Import utility functions (utils.py).
 # These helpers compute hashes (CRC32, MD5, SHA1, ZLE) and read .bps metadata.
-from utils import calculate_crc32, calculate_md5, calculate_sha1, calculate_zle_hash, get_patch_metadata, get_ips_metadata, log_operation_paths, format_log_field, has_ines_header, has_snes_copier_header, remove_ines_header_bytes, remove_snes_copier_header_bytes, rewrite_rom_file_with_header_options, normalize_rom_extension, validate_ips_base_rom, get_rom_family_display
+from utils import calculate_crc32, calculate_md5, calculate_sha1, calculate_zle_hash, calculate_all_hashes, get_patch_metadata, get_patch_footer, get_ips_metadata, log_operation_paths, format_log_field, has_ines_header, has_snes_copier_header, remove_ines_header_bytes, remove_snes_copier_header_bytes, rewrite_rom_file_with_header_options, normalize_rom_extension, validate_ips_base_rom, get_rom_family_display, iter_files_with_extensions, merge_unique_paths, ROM_SEARCH_EXTENSIONS, run_flips, flips_output_text
 
 # Import Nintendo 64 ROM endian swap helpers (rom_byteswap.py).
 # Used by the optional Byte-Swap feature in the GUI.
@@ -84,14 +88,21 @@ if getattr(sys, 'frozen', False):  # Running as a bundled EXE.
 else:  # Running as a normal .py
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
+def _first_existing(*paths, default=None):
+    """Return the first path that is an existing file, or ``default`` (one stat per candidate)."""
+    for p in paths:
+        if os.path.isfile(p):
+            return p
+    return default
+
+
 # Primary expected locations for flips.exe.
 # Try each candidate in order and keep the first one that actually exists.
-_flips_candidates = [
+flips_exe_path = _first_existing(
     os.path.join(script_dir, 'flips.exe'),
     os.path.join(script_dir, 'flips', 'flips.exe'),
     os.path.join(script_dir, '_internal', 'flips', 'flips.exe'),
-]
-flips_exe_path = next((p for p in _flips_candidates if os.path.exists(p)), None)
+)
 
 # If still not found, raise an error.
 if not flips_exe_path:
@@ -99,30 +110,65 @@ if not flips_exe_path:
 
 
 # Icon: search multiple possible locations
-icon_candidates = [
+icon_path = _first_existing(
     os.path.join(script_dir, "ico", "flips.ico"),
     os.path.join(script_dir, "flips.ico"),
     os.path.join(script_dir, "_internal", "ico", "flips.ico"),
-]
-
-icon_path = next((p for p in icon_candidates if os.path.exists(p)), None)
+)
 
 # Explorer file-type icons can be different from the app window icon.
 # Prefer file-specific icons when they exist, and only fall back to flips.ico.
-bps_icon_candidates = [
+bps_icon_path = _first_existing(
     os.path.join(script_dir, "ico", "bps.ico"),
     os.path.join(script_dir, "bps.ico"),
     os.path.join(script_dir, "_internal", "ico", "bps.ico"),
-]
-bps_icon_path = next((p for p in bps_icon_candidates if os.path.exists(p)), icon_path)
+    default=icon_path,
+)
 
-ips_icon_candidates = [
+ips_icon_path = _first_existing(
     os.path.join(script_dir, "ico", "ips.ico"),
     os.path.join(script_dir, "ips.ico"),
     os.path.join(script_dir, "_internal", "ico", "ips.ico"),
+    default=icon_path,
+)
+
+# Upper bound on concurrent flips.exe runs for apply/create jobs.
+# flips.exe has no batch/multi-job mode, so every patch is still one process;
+# running several at once is how per-process start-up time gets overlapped.
+_MAX_PATCH_WORKERS = 8
+
+# Hash helpers by the short names used with AutoPatcherApp._cached().
+_HASH_FUNCTIONS = {
+    "crc32": calculate_crc32,
+    "md5": calculate_md5,
+    "sha1": calculate_sha1,
+    "zle": calculate_zle_hash,
+}
+
+# File type filters for ROM pickers.
+ROM_FILE_TYPES = [
+    ("Common ROM Extensions", "*.nes *.fds *.unf *.unif *.sfc *.smc *.swc *.fig *.gba *.agb *.gb *.gbc *.cgb *.sms *.gg *.sg *.pce *.gen *.md *.bin *.rom *.z64 *.n64 *.v64"),
+    ("All Files", "*.*")
 ]
-ips_icon_path = next((p for p in ips_icon_candidates if os.path.exists(p)), icon_path)
 
+# File type filters for patch pickers, keyed by the bps_ips_type value.
+PATCH_FILE_TYPES = {
+    ".bps": [(".BPS Patch Files", "*.bps"), ("All Files", "*.*")],
+    ".ips": [(".IPS Patch Files", "*.ips"), ("All Files", "*.*")],
+}
+
+# Button labels for the search_scope / byteswap_mode values.
+SEARCH_SCOPE_LABELS = {
+    "enable": "Search subfolders",
+    "directory": "Search whole directory",
+    "disable": "Disable expanded file search",
+}
+BYTESWAP_LABELS = {
+    "z64": "Z64 (big-endian)",
+    "n64": "N64 (little-endian)",
+    "v64": "V64 (byte-swapped)",
+    "disable": "Disable endian swapping",
+}
 
 # ===== END SECTION A: Imports & Paths ============================================
 
@@ -145,6 +191,10 @@ class AutoPatcherApp:
       • create_patch()   – Auto Create Patches
     """
 
+    # File type filters for ROM pickers (shared, built once at import).
+    rom_file_types = ROM_FILE_TYPES
+    patch_file_types = PATCH_FILE_TYPES
+
     # ----- START C1: GUI build ---------------------------------------------------
     def __init__(self, root):
         self.root = root
@@ -202,12 +252,17 @@ class AutoPatcherApp:
         ]
         self._patch_job_lock = Lock()
         self._patch_job_running = False
-
-        # File type filters for ROM pickers.
-        self.rom_file_types = [
-            ("Common ROM Extensions", "*.nes *.fds *.unf *.unif *.sfc *.smc *.swc *.fig *.gba *.agb *.gb *.gbc *.cgb *.sms *.gg *.sg *.pce *.gen *.md *.bin *.rom *.z64 *.n64 *.v64"),
-            ("All Files", "*.*")
-        ]
+        # One long-lived worker runs patch jobs in order; Start clicks only enqueue.
+        self._jobs = queue.Queue()
+        self._job_worker = Thread(target=self._run_jobs, daemon=True)
+        self._job_worker.start()
+        # Per-thread log buffer used by the parallel apply/create workers.
+        self._log_capture = local()
+        # Hash results keyed by (abs path, mtime_ns, size) so the same ROM is
+        # not re-read for every patch or display call. Cleared by clear_output().
+        self._hash_cache: dict[tuple[str, int, int], dict[str, object]] = {}
+        # Parsed .bps/.ips metadata, keyed the same way. Cleared by clear_output().
+        self._metadata_cache: dict[tuple[str, int, int], dict] = {}
 
         # Delegate all visible Tkinter widget creation to gui.py.
         build_main_gui(self, root, icon_path=icon_path, script_dir=script_dir)
@@ -396,6 +451,77 @@ class AutoPatcherApp:
             pass
         return True
 
+    def _cached(self, path, kind):
+        """Return the ``kind`` hash ("crc32", "md5", "sha1", "zle") for ``path``, reusing earlier results.
+
+        Entries are keyed by absolute path, modification time, and size, so a file
+        that changes on disk is hashed again instead of serving a stale value.
+        """
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        entry = self._hash_cache.setdefault(key, {})
+        if kind not in entry:
+            entry[kind] = _HASH_FUNCTIONS[kind](path)
+        return entry[kind]
+
+    def _cached_hashes(self, path):
+        """Return every displayed hash for ``path`` from one fused read, reusing cached values.
+
+        The result has the same keys as ``_cached`` kinds, and each value is also
+        stored in the hash cache so later single-kind lookups are free.
+        """
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        entry = self._hash_cache.setdefault(key, {})
+        if not all(kind in entry for kind in _HASH_FUNCTIONS):
+            entry.update(calculate_all_hashes(path))
+        return entry
+
+    def _get_metadata(self, path):
+        """Return patch metadata for ``path`` (BPS or IPS by extension), reusing earlier parses.
+
+        Failed reads (None) are not cached so a later retry can still succeed.
+        """
+        try:
+            st = os.stat(path)
+            key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        metadata = self._metadata_cache.get(key) if key else None
+        if metadata is None:
+            if os.path.splitext(path)[1].lower() == ".ips":
+                metadata = get_ips_metadata(path)
+            else:
+                metadata = get_patch_metadata(path)
+            if metadata is not None and key:
+                self._metadata_cache[key] = metadata
+        return metadata
+
+    def _get_source_crc32(self, patch_file_path):
+        """Return the Source CRC32 text of a BPS patch without hashing the whole patch.
+
+        Uses already-cached full metadata when present, otherwise just the 12-byte footer.
+        """
+        try:
+            st = os.stat(patch_file_path)
+            key = (os.path.abspath(patch_file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        metadata = (self._metadata_cache.get(key) if key else None) or get_patch_footer(patch_file_path)
+        return (metadata or {}).get("Source CRC32")
+
+    def _run_jobs(self):
+        """Job worker loop: run queued patch jobs one at a time for the life of the app."""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                # Same report an unhandled error in a per-job Thread used to give;
+                # the worker must survive to run the next job.
+                import traceback
+                traceback.print_exc()
+
     def _run_background_patch_job(self, target, *, busy_message: str) -> bool:
         if not self._try_begin_patch_job():
             self.log_message(busy_message)
@@ -410,7 +536,7 @@ class AutoPatcherApp:
                 except Exception:
                     self._set_patch_job_running(False)
 
-        Thread(target=_worker, daemon=True).start()
+        self._jobs.put(_worker)
         return True
     # ----- END C1: GUI build ------------------------------------------------------
 
@@ -481,30 +607,19 @@ class AutoPatcherApp:
             except Exception: pass
         # Search scope.
         sc = cfg.get("search_scope")
-        label_map = {
-            "enable": "Search subfolders",
-            "directory": "Search whole directory",
-            "disable": "Disable expanded file search",
-        }
-        if sc in label_map:
+        if sc in SEARCH_SCOPE_LABELS:
             try:
                 self.search_scope.set(sc)
-                self.search_scope_button.config(text=label_map[sc])
+                self.search_scope_button.config(text=SEARCH_SCOPE_LABELS[sc])
             except Exception:
                 pass
 
         # Byte-swap mode.
         bm = cfg.get("byteswap_mode")
-        label_map2 = {
-            "z64": "Z64 (big-endian)",
-            "n64": "N64 (little-endian)",
-            "v64": "V64 (byte-swapped)",
-            "disable": "Disable endian swapping",
-        }
-        if bm in label_map2:
+        if bm in BYTESWAP_LABELS:
             try:
                 self.byteswap_mode.set(bm)
-                self.byteswap_button.config(text=label_map2[bm])
+                self.byteswap_button.config(text=BYTESWAP_LABELS[bm])
             except Exception:
                 pass
 
@@ -588,6 +703,7 @@ class AutoPatcherApp:
             if not path:
                 self.log_message("Save canceled.")
                 return
+            import json
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(cfg, f, indent=2)
             self.log_message(f"Config saved to: {os.path.basename(path)}")
@@ -604,6 +720,7 @@ class AutoPatcherApp:
             if not path:
                 self.log_message("Load canceled.")
                 return
+            import json
             with open(path, "r", encoding="utf-8") as f:
                 cfg = json.load(f)
             self.apply_config(cfg)
@@ -642,6 +759,7 @@ class AutoPatcherApp:
 
     def save_app_settings(self, log_result=False):
         try:
+            import json
             with open(self.settings_json_path, "w", encoding="utf-8") as f:
                 json.dump(self._get_app_settings_payload(), f, indent=2)
             if log_result:
@@ -656,6 +774,7 @@ class AutoPatcherApp:
         try:
             if not os.path.exists(self.settings_json_path):
                 return False
+            import json
             with open(self.settings_json_path, "r", encoding="utf-8") as f:
                 cfg = json.load(f)
             self.apply_config(cfg, log_result=False)
@@ -1391,8 +1510,7 @@ class AutoPatcherApp:
         try:
             if os.path.splitext(patch_file_path)[1].lower() != ".bps":
                 return False
-            metadata = get_patch_metadata(patch_file_path)
-            source_crc = self._normalize_crc32_text((metadata or {}).get("Source CRC32"))
+            source_crc = self._normalize_crc32_text(self._get_source_crc32(patch_file_path))
             if not source_crc:
                 return False
             self.rom_autoselect_cache[source_crc] = os.path.abspath(base_rom_path)
@@ -1417,8 +1535,7 @@ class AutoPatcherApp:
         for patch_file_path in patch_files:
             if os.path.splitext(patch_file_path)[1].lower() != ".bps":
                 return False
-            metadata = get_patch_metadata(patch_file_path)
-            source_crc = self._normalize_crc32_text((metadata or {}).get("Source CRC32"))
+            source_crc = self._normalize_crc32_text(self._get_source_crc32(patch_file_path))
             if not source_crc:
                 return False
             source_crcs.add(source_crc)
@@ -1435,7 +1552,9 @@ class AutoPatcherApp:
             return False
 
         try:
-            actual_crc = f"{calculate_crc32(candidate):#010x}".lower()
+            # Fill every hash now: display_base_rom_hashes() follows a match and
+            # then reuses this read instead of making a second pass.
+            actual_crc = f"{self._cached_hashes(candidate)['crc32']:#010x}".lower()
         except Exception:
             return False
 
@@ -1522,8 +1641,11 @@ class AutoPatcherApp:
     # ----- END C2b: App settings / Windows integration ---------------------------
 
     # ----- START C3: Core operations (create/apply) -------------------------------
-    def create_patches(self):
-        """Create .bps/.ips patches by comparing Base ROM vs each Modified ROM."""
+    def create_patches(self, options):
+        """Create .bps/.ips patches by comparing Base ROM vs each Modified ROM.
+
+        ``options`` is the dict from ``_read_patch_options``, taken on the Tk thread.
+        """
         # Safety checks.
         if not self.base_rom:
             self.log_message("Error: No Base ROM selected. Please select a Base ROM first.")
@@ -1532,23 +1654,75 @@ class AutoPatcherApp:
             self.log_message("Error: No Modified ROM selected. Please select a Modified ROM first.")
             return
 
+        patch_ext = options["patch_ext"]
+        append_suffix = options["append_suffix"]
+
+        # Hash the Base ROM here, once, when some Modified ROM has its size (only
+        # those pairs can be identical). Workers never hash it themselves, so a
+        # cold cache cannot make every pool thread read the Base ROM.
+        base_crc32 = None
+        try:
+            base_size = os.path.getsize(self.base_rom)
+            for rom in self.modified_rom:
+                try:
+                    if os.path.getsize(rom) == base_size:
+                        base_crc32 = self._cached(self.base_rom, "crc32")
+                        break
+                except OSError:
+                    pass
+        except OSError:
+            pass
 
-        # Finds path of the selected in-file name and appends "_patched" to the end of it's out-file name before it's extension.
+        # Modified ROMs that share a stem (game.sfc / game.smc) write the same
+        # patch file, so jobs are grouped by output path. Groups run on a small
+        # thread pool; the ROMs inside one group run one after another.
+        groups = {}
         for rom in self.modified_rom:
-            ext = ".ips" if self.bps_ips_type.get() == ".ips" else ".bps"
-            rom_base = os.path.splitext(rom)[0]
-            patch_file_path = rom_base + ("_patched" if self.append_suffix.get() else "") + ext
+            patch_file_path = os.path.splitext(rom)[0] + ("_patched" if append_suffix else "") + patch_ext
+            groups.setdefault(os.path.normcase(patch_file_path), []).append((rom, patch_file_path))
+
+        def _create_group(jobs):
+            lines = []
+            for rom, patch_file_path in jobs:
+                lines.extend(self._create_one(rom, patch_file_path, base_crc32=base_crc32))
+            return lines
+
+        max_workers = min(_MAX_PATCH_WORKERS, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_create_group, jobs) for jobs in groups.values()]
+            for future in as_completed(futures):
+                self.log_messages(future.result())
+
+        self.log_message("Patch creation process is complete.")
+
+    def _create_one(self, rom, patch_file_path, *, base_crc32):
+        """Create the patch ``patch_file_path`` for ``rom`` on a worker thread and return its log lines.
 
+        ``base_crc32`` is the Base ROM's CRC32 computed by ``create_patches``, or
+        None when no Modified ROM has the Base ROM's size.
+        """
+        self._log_capture.lines = []
+        rom_name = os.path.basename(rom)
+        try:
             # Skip the "Auto Patch Files" and "Auto Create Patches" process if the base and modified ROM are the same file.
-            if os.path.abspath(rom) == os.path.abspath(self.base_rom):
+            try:
+                same_file = os.path.samefile(rom, self.base_rom)
+            except OSError:
+                same_file = os.path.abspath(rom) == os.path.abspath(self.base_rom)
+            if same_file:
                 self.log_message("Error: Base ROM and Modified ROM must cannot be the same file. Ignoring this one.")
-                continue
+                return self._log_capture.lines
 
             # Skip identical files that don’t need a patch.
+            # Files of different sizes cannot be identical, so only equal-size
+            # pairs hash the Modified ROM.
             try:
-                if calculate_crc32(self.base_rom) == calculate_crc32(rom):
-                    self.log_message(f"Skipping {os.path.basename(rom)}: Base and Modified are identical (no patch needed).")
-                    continue
+                identical = False
+                if base_crc32 is not None and os.path.getsize(self.base_rom) == os.path.getsize(rom):
+                    identical = self._cached(rom, "crc32") == base_crc32
+                if identical:
+                    self.log_message(f"Skipping {rom_name}: Base and Modified are identical (no patch needed).")
+                    return self._log_capture.lines
             except Exception:
                 pass
 
@@ -1557,7 +1731,7 @@ class AutoPatcherApp:
 
             try:
                 command = [flips_exe_path, '--create', create_base_rom_path, create_modified_rom_path, patch_file_path]
-                subprocess.run(command, check=True, capture_output=True, text=True)
+                run_flips(command)
                 self.log_message(f"Successfully created patch: {os.path.basename(patch_file_path)}")
                 log_operation_paths(
                     self.log_message,
@@ -1567,31 +1741,43 @@ class AutoPatcherApp:
                     output_file_path=patch_file_path,
                 )
             except subprocess.CalledProcessError as e:
-                msg_out = (e.stdout or '').strip()
-                msg_err = (e.stderr or '').strip()
+                msg_out = flips_output_text(e)
                 if 'The files are identical' in msg_out:
-                    self.log_message(f"Skipping {os.path.basename(rom)}: files are identical.")
+                    self.log_message(f"Skipping {rom_name}: files are identical.")
                 else:
-                    self.log_message(f"Error creating patch for {os.path.basename(rom)}:")
+                    self.log_message(f"Error creating patch for {rom_name}:")
                     self.log_message(f"  Command: {' '.join(command)}")
-                    self.log_message(f"  Stdout: {msg_out if msg_out else 'No output'}")
-                    self.log_message(f"  Stderr: {msg_err if msg_err else 'Unknown error occurred.'}")
+                    self.log_message(f"  Output: {msg_out if msg_out else 'No output'}")
+            return self._log_capture.lines
+        except Exception as e:
+            # Keep the lines captured so far; they show how far the job got.
+            self.log_message(f"Error creating patch for {rom_name}: {e}")
+            return self._log_capture.lines
+        finally:
+            self._log_capture.lines = None
 
-        self.log_message("Patch creation process is complete.")
+    def _prepare_patch_input_rom(self, patch_file_path, base_rom_extension, options):
+        """Return (input_rom_path, header_context) after optional temporary header removal.
 
-    def _prepare_patch_input_rom(self, patch_file_path, base_rom_extension):
-        """Return (input_rom_path, header_context) after optional temporary header removal."""
+        ``options`` is the dict from ``_read_patch_options``.
+        """
         input_rom_path = self.base_rom
         header_context = {"temp_input_rom_path": None, "restore_ines_header": b""}
 
         base_ext = normalize_rom_extension(self.base_rom)
+        wants_ines = base_ext == "nes" and options["temp_remove_ines_header"]
+        wants_snes = base_ext in {"sfc", "smc", "swc", "fig"} and options["temp_remove_snes_header"]
+        if not (wants_ines or wants_snes):
+            # No header option applies, so skip reading the whole Base ROM for every patch.
+            return input_rom_path, header_context
+
         patch_name = os.path.basename(patch_file_path)
         base_name = os.path.basename(self.base_rom)
         try:
             with open(self.base_rom, "rb") as f:
                 base_data = f.read()
 
-            if base_ext == "nes" and self.temp_remove_ines_header.get():
+            if wants_ines:
                 self.log_message(f"ROM header options: checking Base ROM for temporary iNES header removal before applying {patch_name}.")
                 if has_ines_header(base_data, self.base_rom):
                     with tempfile.NamedTemporaryFile(delete=False, suffix=base_rom_extension) as tmp:
@@ -1602,10 +1788,10 @@ class AutoPatcherApp:
                     self.log_message(f"Removed iNES header temporarily for patch input: {base_name}")
                 else:
                     self.log_message(f"No iNES header found on Base ROM: {base_name}")
-                    self.log_message(f"ROM header options: no iNES header to remove; will add iNES copier header to output after patching: {os.path.basename(patch_file_path)}")
+                    self.log_message(f"ROM header options: no iNES header to remove; will add iNES copier header to output after patching: {patch_name}")
                     self.log_message("")
 
-            elif base_ext in {"sfc", "smc", "swc", "fig"} and self.temp_remove_snes_header.get():
+            elif wants_snes:
                 self.log_message(f"ROM header options: checking Base ROM for temporary SNES copier header removal before applying {patch_name}.")
                 if has_snes_copier_header(base_data, self.base_rom):
                     with tempfile.NamedTemporaryFile(delete=False, suffix=base_rom_extension) as tmp:
@@ -1615,7 +1801,7 @@ class AutoPatcherApp:
                     self.log_message(f"Removed SNES copier header temporarily for patch input: {base_name}")
                 else:
                     self.log_message(f"No SNES copier header found on Base ROM: {base_name}")
-                    self.log_message(f"ROM header options: no SNES copier header to remove; will add SNES copier header to output after patching: {os.path.basename(patch_file_path)}")
+                    self.log_message(f"ROM header options: no SNES copier header to remove; will add SNES copier header to output after patching: {patch_name}")
                     self.log_message("")
         except Exception as e:
             self.log_message(f"Failed to prepare temporary header-adjusted input ROM: {e}")
@@ -1659,7 +1845,7 @@ class AutoPatcherApp:
 
         return input_rom_path, temp_input_rom_path
 
-    def _apply_output_header_options(self, patched_rom_path, header_context=None):
+    def _apply_output_header_options(self, patched_rom_path, header_context, options):
         """Apply optional output header transforms and log exactly what happened."""
         header_context = header_context or {}
         base_ext = normalize_rom_extension(self.base_rom)
@@ -1667,8 +1853,8 @@ class AutoPatcherApp:
 
         try:
             if base_ext == "nes":
-                add_out = bool(self.temp_remove_ines_header.get() or self.add_ines_header.get())
-                remove_out = bool(self.remove_ines_header.get())
+                add_out = options["temp_remove_ines_header"] or options["add_ines_header"]
+                remove_out = options["remove_ines_header"]
                 if add_out and remove_out:
                     self.log_message(f"ROM header options: conflicting NES output options; leaving output unchanged: {output_name}")
                     return
@@ -1687,8 +1873,8 @@ class AutoPatcherApp:
                     return
 
             if base_ext in {"sfc", "smc", "swc", "fig"}:
-                add_out = bool(self.temp_remove_snes_header.get() or self.add_snes_header.get())
-                remove_out = bool(self.remove_snes_header.get())
+                add_out = options["temp_remove_snes_header"] or options["add_snes_header"]
+                remove_out = options["remove_snes_header"]
                 if add_out and remove_out:
                     self.log_message(f"ROM header options: conflicting SNES output options; leaving output unchanged: {output_name}")
                     return
@@ -1705,100 +1891,186 @@ class AutoPatcherApp:
         except Exception as e:
             self.log_message(f"Failed to apply output header options: {e}")
 
-    def apply_patches(self):
+    def _apply_one(self, patch_file_path, patched_rom_path, *, base_crc32, force_patch, options):
+        """Apply one patch file to the Base ROM on a worker thread, writing ``patched_rom_path``.
 
-        """Apply each selected .bps/.ips patch to the selected Base ROM."""
-        if not self.base_rom:
-            self.log_message("Error: No Base ROM selected. Please select a Base ROM first.")
-            return
-
-        for patch_file_path in self.patch_files:
-            base_rom_extension = os.path.splitext(self.base_rom)[1]
-            patched_rom_base = os.path.splitext(patch_file_path)[0]
-            patched_rom_path = (patched_rom_base + "_patched" + base_rom_extension) if self.append_suffix.get() else (patched_rom_base + base_rom_extension)
-
-            header_context = {}
+        Returns ``(log_lines, patched_rom_path)``. The path is None when the patch
+        was skipped or failed, so the caller only records/launches real outputs.
+        """
+        self._log_capture.lines = []
+        result_path = None
+        header_context = {}
+        patch_name = os.path.basename(patch_file_path)
+        base_rom_extension = os.path.splitext(self.base_rom)[1]
+        try:
             try:
-                input_rom_path, header_context = self._prepare_patch_input_rom(patch_file_path, base_rom_extension)
+                input_rom_path, header_context = self._prepare_patch_input_rom(patch_file_path, base_rom_extension, options)
             except Exception:
-                continue
+                return self._log_capture.lines, None
 
             patch_ext = os.path.splitext(patch_file_path)[1].lower()
-            metadata = get_patch_metadata(patch_file_path) if patch_ext == ".bps" else get_ips_metadata(patch_file_path)
-            base_crc32 = calculate_crc32(input_rom_path)
+            metadata = self._get_metadata(patch_file_path)
+            # A temporary header-stripped input has its own CRC32.
+            if input_rom_path == self.base_rom:
+                input_crc32 = base_crc32
+            else:
+                input_crc32 = self._cached(input_rom_path, "crc32")
 
-            source_crc32 = None
+            # Compare as integers so "0X..."/"0x..." text differences cannot matter.
+            crc_mismatch = False
             if patch_ext == ".bps" and metadata and "Source CRC32" in metadata:
-                source_crc32 = metadata["Source CRC32"]
-                if f"{base_crc32:#010x}" != source_crc32:
-                    if self.force_patch.get():
-                        self.log_message(f"Force to Patch enabled. Applying patch for {os.path.basename(patch_file_path)} despite CRC32 mismatch.")
+                crc_mismatch = input_crc32 != int(metadata["Source CRC32"], 16)
+                if crc_mismatch:
+                    if force_patch:
+                        self.log_message(f"Force to Patch enabled. Applying patch for {patch_name} despite CRC32 mismatch.")
                     else:
-                        self.log_message(f"Skipping patching for {os.path.basename(patch_file_path)} due to CRC32 mismatch.")
-                        continue
+                        self.log_message(f"Skipping patching for {patch_name} due to CRC32 mismatch.")
+                        return self._log_capture.lines, None
                 else:
-                    self.log_message(f"CRC32 match for {os.path.basename(patch_file_path)}. Proceeding with patch.")
+                    self.log_message(f"CRC32 match for {patch_name}. Proceeding with patch.")
             elif patch_ext == ".ips":
                 ok, reason, details = validate_ips_base_rom(patch_file_path, input_rom_path)
-                if not ok and not self.force_patch.get():
-                    self.log_message(f"Skipping patching for {os.path.basename(patch_file_path)} due to IPS validation failure: {reason}.")
-                    continue
+                if not ok and not force_patch:
+                    self.log_message(f"Skipping patching for {patch_name} due to IPS validation failure: {reason}.")
+                    return self._log_capture.lines, None
                 if ok:
-                    self.log_message(f"IPS size passed for {os.path.basename(patch_file_path)}. Proceeding with patch.")
+                    self.log_message(f"IPS size passed for {patch_name}. Proceeding with patch.")
                 else:
-                    self.log_message(f"Force to Patch enabled. Applying IPS patch for {os.path.basename(patch_file_path)} despite validation failure: {reason}.")
+                    self.log_message(f"Force to Patch enabled. Applying IPS patch for {patch_name} despite validation failure: {reason}.")
 
             try:
-                if self.force_patch.get() and source_crc32 and f"{base_crc32:#010x}" != source_crc32:
+                if force_patch and crc_mismatch:
                     command = [flips_exe_path, '--apply', '--ignore-checksum', patch_file_path, input_rom_path, patched_rom_path]
                 else:
                     command = [flips_exe_path, '--apply', patch_file_path, input_rom_path, patched_rom_path]
 
-                subprocess.run(command, check=True, capture_output=True, text=True)
-                self._apply_output_header_options(patched_rom_path, header_context)
+                run_flips(command)
+                self._apply_output_header_options(patched_rom_path, header_context, options)
 
-                if self.force_patch.get() and source_crc32 and f"{base_crc32:#010x}" != source_crc32:
+                if force_patch and crc_mismatch:
                     self.log_message(f"Successfully applied patch despite errors: {os.path.basename(patched_rom_path)}")
                 else:
                     self.log_message(f"Successfully applied patch: {os.path.basename(patched_rom_path)}")
 
-                patched_rom_path = self._apply_byteswap_to_output(patched_rom_path)
-                patched_rom_path = self._apply_trim_to_64mb_output(patched_rom_path)
+                patched_rom_path = self._apply_byteswap_to_output(patched_rom_path, options["byteswap_mode"])
+                patched_rom_path = self._apply_trim_to_64mb_output(patched_rom_path, options["trim_64mb"])
                 log_operation_paths(
                     self.log_message,
                     patch_file_path=patch_file_path,
                     base_rom_path=input_rom_path,
                     output_file_path=patched_rom_path,
                 )
-                self._remember_base_rom_for_patch(patch_file_path, self.base_rom)
-                self.launch_emulator_if_configured(patched_rom_path)
+                result_path = patched_rom_path
 
             except subprocess.CalledProcessError as e:
                 if not os.path.exists(patched_rom_path):
-                    self.log_message(f"Error applying patch [{os.path.basename(patch_file_path)}]:")
+                    msg_out = flips_output_text(e)
+                    self.log_message(f"Error applying patch [{patch_name}]:")
                     self.log_message(f"  Command: {' '.join(command)}")
-                    self.log_message(f"  Stdout: {e.stdout.strip() if e.stdout else 'No output'}")
-                    self.log_message(f"  Stderr: {e.stderr.strip() if e.stderr else 'Unknown error occurred.'}")
+                    self.log_message(f"  Output: {msg_out if msg_out else 'No output'}")
                 else:
-                    self._apply_output_header_options(patched_rom_path, header_context)
+                    self._apply_output_header_options(patched_rom_path, header_context, options)
                     self.log_message(f"Successfully applied patch despite errors: [{os.path.basename(patched_rom_path)}]")
-                    patched_rom_path = self._apply_byteswap_to_output(patched_rom_path)
-                    patched_rom_path = self._apply_trim_to_64mb_output(patched_rom_path)
+                    patched_rom_path = self._apply_byteswap_to_output(patched_rom_path, options["byteswap_mode"])
+                    patched_rom_path = self._apply_trim_to_64mb_output(patched_rom_path, options["trim_64mb"])
                     log_operation_paths(
                         self.log_message,
                         patch_file_path=patch_file_path,
                         base_rom_path=input_rom_path,
                         output_file_path=patched_rom_path,
                     )
-                    self._remember_base_rom_for_patch(patch_file_path, self.base_rom)
-                    self.launch_emulator_if_configured(patched_rom_path)
-            finally:
-                temp_input_rom_path = (header_context or {}).get('temp_input_rom_path')
-                if temp_input_rom_path and os.path.exists(temp_input_rom_path):
-                    try:
-                        os.remove(temp_input_rom_path)
-                    except Exception:
-                        pass
+                    result_path = patched_rom_path
+            return self._log_capture.lines, result_path
+        except Exception as e:
+            self.log_message(f"Error applying patch [{patch_name}]: {e}")
+            return self._log_capture.lines, None
+        finally:
+            self._log_capture.lines = None
+            temp_input_rom_path = (header_context or {}).get('temp_input_rom_path')
+            if temp_input_rom_path and os.path.exists(temp_input_rom_path):
+                try:
+                    os.remove(temp_input_rom_path)
+                except Exception:
+                    pass
+
+    def _read_patch_options(self):
+        """Read the patch type, suffix, force, header, byte-swap and trim options into a plain dict.
+
+        Called on the Tk thread before a create/apply job is queued, so the job
+        worker and its pool threads never touch the Tk variables.
+        """
+        options = {
+            name: bool(getattr(self, name).get())
+            for name in (
+                "temp_remove_ines_header", "temp_remove_snes_header",
+                "add_ines_header", "remove_ines_header",
+                "add_snes_header", "remove_snes_header",
+            )
+        }
+        try:
+            options["byteswap_mode"] = self.byteswap_mode.get()
+        except Exception:
+            options["byteswap_mode"] = "disable"
+        try:
+            options["trim_64mb"] = bool(self.trim_64mb.get())
+        except Exception:
+            options["trim_64mb"] = False
+        options["patch_ext"] = ".ips" if self.bps_ips_type.get() == ".ips" else ".bps"
+        options["append_suffix"] = bool(self.append_suffix.get())
+        options["force_patch"] = bool(self.force_patch.get())
+        return options
+
+    def apply_patches(self, options):
+
+        """Apply each selected .bps/.ips patch to the selected Base ROM.
+
+        flips.exe runs are spread over a small thread pool, except that patches
+        writing the same output file run one after another. Log lines from one
+        patch are emitted together once that patch finishes. ``options`` is the
+        dict from ``_read_patch_options``, taken on the Tk thread.
+        """
+        if not self.base_rom:
+            self.log_message("Error: No Base ROM selected. Please select a Base ROM first.")
+            return
+
+        # The Base ROM does not change inside the loop, so hash it once.
+        base_rom_extension = os.path.splitext(self.base_rom)[1]
+        base_crc32 = self._cached(self.base_rom, "crc32")
+        force_patch = options["force_patch"]
+        append_suffix = options["append_suffix"]
+
+        # Patches that share a stem (hack.bps / hack.ips) write the same output
+        # ROM, so jobs are grouped by output path. Groups run on a small thread
+        # pool; the patches inside one group run one after another.
+        groups = {}
+        for patch_file_path in self.patch_files:
+            patched_rom_base = os.path.splitext(patch_file_path)[0]
+            patched_rom_path = (patched_rom_base + "_patched" + base_rom_extension) if append_suffix else (patched_rom_base + base_rom_extension)
+            groups.setdefault(os.path.normcase(patched_rom_path), []).append((patch_file_path, patched_rom_path))
+
+        def _apply_group(jobs):
+            results = []
+            for patch_file_path, patched_rom_path in jobs:
+                lines, result_path = self._apply_one(
+                    patch_file_path,
+                    patched_rom_path,
+                    base_crc32=base_crc32,
+                    force_patch=force_patch,
+                    options=options,
+                )
+                results.append((patch_file_path, lines, result_path))
+            return results
+
+        max_workers = min(_MAX_PATCH_WORKERS, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_apply_group, jobs) for jobs in groups.values()]
+            for future in as_completed(futures):
+                for patch_file_path, lines, patched_rom_path in future.result():
+                    self.log_messages(lines)
+                    if patched_rom_path:
+                        # Settings writes and emulator launches stay on this thread.
+                        self._remember_base_rom_for_patch(patch_file_path, self.base_rom)
+                        self.launch_emulator_if_configured(patched_rom_path)
 
         self.log_message("Patching process is complete.")
     # ----- END C3: Core operations (create/apply) ---------------------------------
@@ -1818,14 +2090,14 @@ class AutoPatcherApp:
         self.force_patch.set(False)
         try:
             self.search_scope.set("disable")
-            self.search_scope_button.config(text="Disable expanded file search")
+            self.search_scope_button.config(text=SEARCH_SCOPE_LABELS["disable"])
         except Exception:
             pass
 
         # Reset byte-swap option.
         try:
             self.byteswap_mode.set("disable")
-            self.byteswap_button.config(text="Disable endian swapping")
+            self.byteswap_button.config(text=BYTESWAP_LABELS["disable"])
         except Exception:
             pass
 
@@ -1860,6 +2132,8 @@ class AutoPatcherApp:
         self.modified_rom = None
         self.patch_files = []
         self.patch_folder = None
+        self._hash_cache.clear()
+        self._metadata_cache.clear()
 
         # Reset visible .BPS/.IPS label + selector icon.
         self.select_files(".bps")
@@ -1872,6 +2146,12 @@ class AutoPatcherApp:
 
     def log_message(self, message):
         # Append a line to the Info/Output box (buffered + cleaned).
+        # Lines from a parallel apply/create worker are held until that job
+        # finishes so each patch keeps one contiguous block in the output.
+        captured = getattr(getattr(self, "_log_capture", None), "lines", None)
+        if captured is not None:
+            captured.append(message)
+            return
         try:
             if hasattr(self, "logger") and self.logger is not None:
                 self.logger.write(message)
@@ -1883,7 +2163,23 @@ class AutoPatcherApp:
         self.console_output.insert(tk.END, f"{message}\n")
         self.console_output.configure(state='disabled')
         self.console_output.see(tk.END)
-        self.root.update_idletasks()
+
+    def log_messages(self, messages):
+        # Append several lines as one block (one queue hand-off, one flush),
+        # so multi-line reports are not split by output from other threads.
+        messages = list(messages)
+        captured = getattr(getattr(self, "_log_capture", None), "lines", None)
+        if captured is not None:
+            captured.extend(messages)
+            return
+        try:
+            if hasattr(self, "logger") and self.logger is not None:
+                self.logger.write_lines(messages)
+                return
+        except Exception:
+            pass
+        for message in messages:
+            self.log_message(message)
 
     def _sync_option_states(self):
         """Enable/disable mode-specific options so they behave predictably."""
@@ -1930,7 +2226,7 @@ class AutoPatcherApp:
                 pass
             try:
                 self.byteswap_mode.set("disable")
-                self.byteswap_button.config(text="Disable endian swapping")
+                self.byteswap_button.config(text=BYTESWAP_LABELS["disable"])
             except Exception:
                 pass
             try:
@@ -2007,10 +2303,15 @@ class AutoPatcherApp:
         except Exception:
             return "Unknown (read error)"
 
-    def _log_byteswap_non_n64_warning_if_needed(self, file_path: str):
-        """If byte-swap is enabled and file is not an N64 type, print the requested message."""
+    def _log_byteswap_non_n64_warning_if_needed(self, file_path: str, byteswap_mode=None):
+        """If byte-swap is enabled and file is not an N64 type, print the requested message.
+
+        Off the Tk thread, pass ``byteswap_mode`` instead of letting it read the Tk variable.
+        """
         try:
-            if self.byteswap_mode.get() == "disable":
+            if byteswap_mode is None:
+                byteswap_mode = self.byteswap_mode.get()
+            if byteswap_mode == "disable":
                 return
             ext = os.path.splitext(file_path)[1].lower()
             if ext not in {".z64", ".n64", ".v64"}:
@@ -2018,17 +2319,11 @@ class AutoPatcherApp:
         except Exception:
             pass
 
-    def _apply_byteswap_to_output(self, patched_rom_path: str) -> str:
-        """Optionally convert a patched N64 ROM to the selected byte order.
+    def _apply_byteswap_to_output(self, patched_rom_path: str, mode: str) -> str:
+        """Optionally convert a patched N64 ROM to the byte order ``mode`` ('disable' skips it).
 
         Returns the final output path (may be unchanged).
         """
-        mode = "disable"
-        try:
-            mode = self.byteswap_mode.get()
-        except Exception:
-            mode = "disable"
-
         if mode == "disable":
             return patched_rom_path
 
@@ -2077,17 +2372,12 @@ class AutoPatcherApp:
             self.log_message(f"Byte-swap write error: {e}")
             return patched_rom_path
 
-    def _apply_trim_to_64mb_output(self, patched_rom_path: str) -> str:
+    def _apply_trim_to_64mb_output(self, patched_rom_path: str, enabled: bool) -> str:
         """Optionally trim the patched output ROM to 64MiB.
 
         This is an experimental N64-only feature that truncates data past 64MiB.
         Returns the final output path (unchanged filename; may be unmodified).
         """
-        try:
-            enabled = bool(self.trim_64mb.get())
-        except Exception:
-            enabled = False
-
         if not enabled:
             return patched_rom_path
 
@@ -2106,43 +2396,82 @@ class AutoPatcherApp:
     def display_patch_metadata(self, file_path):
         """Log patch-file metadata. For .bps we show embedded Source/Target CRC32. For .ips we show IPS requirements."""
         ext = os.path.splitext(file_path)[1].lower()
-        if ext == ".ips":
-            metadata = get_ips_metadata(file_path)
-        else:
-            metadata = get_patch_metadata(file_path)
+        metadata = self._get_metadata(file_path)
 
         if metadata:
             header = f"IPS Patch File Hashes ({os.path.basename(file_path)}):" if ext == ".ips" else f"Patch File Hashes ({os.path.basename(file_path)}):"
-            self.log_message(header)
+            lines = [header]
             for key, value in metadata.items():
-                self.log_message(format_log_field(key, value))
+                lines.append(format_log_field(key, value))
             if ext == ".bps" and self.base_rom:
                 try:
                     family = get_rom_family_display(self.base_rom)
                 except Exception:
                     family = ""
                 if family:
-                    self.log_message(format_log_field("Family", family))
+                    lines.append(format_log_field("Family", family))
+            self.log_messages(lines)
         else:
             self.log_message(f"No metadata available for {os.path.basename(file_path)}.")
+        # Returned so callers can reuse the parse; it is also cached by _get_metadata().
+        return metadata
 
-    def display_modified_rom_hashes(self, file_path):
+    def display_modified_rom_hashes(self, file_path, byteswap_mode=None):
         """Compute and log a few hashes for a ROM so users can verify files."""
-        crc32 = calculate_crc32(file_path)
-        md5 = calculate_md5(file_path)
-        sha1 = calculate_sha1(file_path)
-        zle = calculate_zle_hash(file_path)
-        self.log_message(f"Modified ROM Hashes ({os.path.basename(file_path)}):")
-        self.log_message(format_log_field("CRC32", f"{crc32:#010x}"))
-        self.log_message(format_log_field("MD5", md5))
-        self.log_message(format_log_field("SHA-1", sha1))
-        self.log_message(format_log_field("ZLE", zle))
+        hashes = self._cached_hashes(file_path)
+        lines = [
+            f"Modified ROM Hashes ({os.path.basename(file_path)}):",
+            format_log_field("CRC32", f"{hashes['crc32']:#010x}"),
+            format_log_field("MD5", hashes['md5']),
+            format_log_field("SHA-1", hashes['sha1']),
+            format_log_field("ZLE", hashes['zle']),
+        ]
 
         endian = self._describe_n64_endian(file_path)
         if endian:
-            self.log_message(format_log_field("Endian", endian))
-        else:
-            self._log_byteswap_non_n64_warning_if_needed(file_path)
+            lines.append(format_log_field("Endian", endian))
+        self.log_messages(lines)
+        if not endian:
+            self._log_byteswap_non_n64_warning_if_needed(file_path, byteswap_mode)
+
+    def _display_modified_rom_hashes_async(self, roms):
+        """Log each Modified ROM's selection line and hashes from a worker thread.
+
+        Returns an Event that is set once every ROM has been logged. ROMs are
+        hashed in parallel (hashlib/zlib release the GIL), and each ROM's lines
+        are handed to the log as one block in the original selection order.
+        ``roms`` may be a generator (for example a folder scan); it is consumed
+        on the worker, and each ROM is hashed as soon as it is produced.
+        """
+        done = Event()
+        byteswap_mode = self.byteswap_mode.get()
+
+        def hash_lines(rom):
+            self._log_capture.lines = [f"Selected Modified ROM file: {os.path.basename(rom)}"]
+            try:
+                self.display_modified_rom_hashes(rom, byteswap_mode)
+            except Exception as e:
+                self._log_capture.lines.append(f"Hash error for {os.path.basename(rom)}: {e}")
+            finally:
+                lines, self._log_capture.lines = self._log_capture.lines, None
+            return lines
+
+        def worker():
+            try:
+                pending = deque()
+                with ThreadPoolExecutor(max_workers=_MAX_PATCH_WORKERS) as pool:
+                    for rom in roms:
+                        pending.append(pool.submit(hash_lines, rom))
+                        # Post finished blocks while later ROMs are still coming in.
+                        while pending and pending[0].done():
+                            self.log_messages(pending.popleft().result())
+                    while pending:
+                        self.log_messages(pending.popleft().result())
+            finally:
+                done.set()
+
+        Thread(target=worker, daemon=True).start()
+        return done
 
     def file_search_rom(self, *, title_override=None, info_message=None):
         """Open a file dialog to pick a Base ROM and then log its hashes."""
@@ -2162,6 +2491,9 @@ class AutoPatcherApp:
         """Return a short human-readable header detection summary for the selected ROM."""
         try:
             ext = normalize_rom_extension(rom_path)
+            if ext not in {"nes", "sfc", "smc", "swc", "fig"}:
+                # Skip the full read for ROM types with no header detection.
+                return "Not applicable for this ROM type"
             with open(rom_path, "rb") as f:
                 data = f.read()
         except Exception:
@@ -2266,21 +2598,21 @@ class AutoPatcherApp:
     def display_base_rom_hashes(self):
         """Log hashes for the selected Base ROM (helps users verify they picked the right file)."""
         if self.base_rom:
-            crc32 = calculate_crc32(self.base_rom)
-            md5 = calculate_md5(self.base_rom)
-            sha1 = calculate_sha1(self.base_rom)
-            zle = calculate_zle_hash(self.base_rom)
-            self.log_message(f"Base ROM Hashes ({os.path.basename(self.base_rom)}):")
-            self.log_message(format_log_field("CRC32", f"{crc32:#010x}"))
-            self.log_message(format_log_field("MD5", md5))
-            self.log_message(format_log_field("SHA-1", sha1))
-            self.log_message(format_log_field("ZLE", zle))
-            self.log_message(format_log_field("Header Detection", self._get_header_detection_text(self.base_rom)))
+            hashes = self._cached_hashes(self.base_rom)
+            lines = [
+                f"Base ROM Hashes ({os.path.basename(self.base_rom)}):",
+                format_log_field("CRC32", f"{hashes['crc32']:#010x}"),
+                format_log_field("MD5", hashes['md5']),
+                format_log_field("SHA-1", hashes['sha1']),
+                format_log_field("ZLE", hashes['zle']),
+                format_log_field("Header Detection", self._get_header_detection_text(self.base_rom)),
+            ]
 
             endian = self._describe_n64_endian(self.base_rom)
             if endian:
-                self.log_message(format_log_field("Endian", endian))
-            else:
+                lines.append(format_log_field("Endian", endian))
+            self.log_messages(lines)
+            if not endian:
                 self._log_byteswap_non_n64_warning_if_needed(self.base_rom)
     # ----- END C4: Small utilities -----------------------------------------------
 
@@ -2333,40 +2665,23 @@ class AutoPatcherApp:
             # Automatic patching workflows keep the patch picker + base ROM picker flow.
             self.patch_files = filedialog.askopenfilenames(
                 title="Select the Patch file (drag for multi-select).",
-                filetypes=[(".BPS Patch Files", "*.bps"), ("All Files", "*.*")]
-                if self.bps_ips_type.get() == ".bps"
-                else [(".IPS Patch Files", "*.ips"), ("All Files", "*.*")]
+                filetypes=self.patch_file_types[".bps" if self.bps_ips_type.get() == ".bps" else ".ips"]
             )
             if not self.patch_files:
                 self.log_message("No Patch Files selected.")
                 return
+            self.patch_files = [os.path.abspath(p) for p in self.patch_files]
 
             if self.patch_files:
                 try:
                     scope = self.search_scope.get()
-                    base_dir = os.path.dirname(self.patch_files[0])
-                    target_ext = ".bps" if self.bps_ips_type.get() == ".bps" else ".ips"
+                    base_dir = os.path.abspath(os.path.dirname(self.patch_files[0]))
+                    target_ext = "bps" if self.bps_ips_type.get() == ".bps" else "ips"
                     collected = []
-                    if scope == "enable":
-                        for root, _, files in os.walk(base_dir):
-                            for fname in files:
-                                if fname.lower().endswith(target_ext):
-                                    collected.append(os.path.join(root, fname))
-                    elif scope == "directory":
-                        try:
-                            for fname in os.listdir(base_dir):
-                                full = os.path.join(base_dir, fname)
-                                if os.path.isfile(full) and fname.lower().endswith(target_ext):
-                                    collected.append(full)
-                        except Exception:
-                            pass
-                    original = list(self.patch_files)
-                    seen = set(original)
-                    for f in collected:
-                        if f not in seen:
-                            original.append(f)
-                            seen.add(f)
-                    self.patch_files = original
+                    if scope in ("enable", "directory"):
+                        collected = list(iter_files_with_extensions(base_dir, {target_ext},
+                                                                    recurse=(scope == "enable"), skip_hidden=True))
+                    self.patch_files = merge_unique_paths(self.patch_files, collected)
                 except Exception as e:
                     self.log_message(f"Search expansion error: {e}")
 
@@ -2380,20 +2695,25 @@ class AutoPatcherApp:
                 self.log_message(f"Selected Patch File: {os.path.basename(patch_file)}")
                 self.display_patch_metadata(patch_file)
 
+            options = self._read_patch_options()
+
+            # Collect every path block first and hand them to the log in one batch.
+            path_lines = []
+            base_rom_extension = os.path.splitext(self.base_rom)[1]
             for patch_file_path in self.patch_files:
-                base_rom_extension = os.path.splitext(self.base_rom)[1]
                 patched_rom_base = os.path.splitext(patch_file_path)[0]
-                predicted_output_path = (patched_rom_base + "_patched" + base_rom_extension) if self.append_suffix.get() else (patched_rom_base + base_rom_extension)
+                predicted_output_path = (patched_rom_base + "_patched" + base_rom_extension) if options["append_suffix"] else (patched_rom_base + base_rom_extension)
                 log_operation_paths(
-                    self.log_message,
+                    path_lines.append,
                     patch_file_path=patch_file_path,
                     base_rom_path=self.base_rom,
                     output_file_path=predicted_output_path,
                 )
+            self.log_messages(path_lines)
 
             self.log_message("Patching process has started.")
             self._run_background_patch_job(
-                self.apply_patches,
+                lambda: self.apply_patches(options),
                 busy_message="A patching job is already running. Please wait for it to finish.",
             )
 
@@ -2406,36 +2726,22 @@ class AutoPatcherApp:
             if not self.modified_rom:
                 self.log_message("No valid Modified ROM files selected.")
                 return
+            self.modified_rom = [os.path.abspath(p) for p in self.modified_rom]
 
             # (2) Optional expanded selection based on the folder of the first pick.
             if self.modified_rom:
                 try:
                     scope = self.search_scope.get()
-                    base_dir = os.path.dirname(self.modified_rom[0])
-                    rom_exts = (".nes", ".sfc", ".smc", ".gba", ".gbc", ".gen", ".md", ".bin", ".rom", ".z64", ".n64", ".v64", ".sms", ".pce")
+                    base_dir = os.path.abspath(os.path.dirname(self.modified_rom[0]))
                     collected = []
                     abs_base = os.path.abspath(self.base_rom) if self.base_rom else None
-                    if scope == "enable":
-                        for root, _, files in os.walk(base_dir):
-                            for fname in files:
-                                full = os.path.abspath(os.path.join(root, fname))
-                                if full.lower().endswith(rom_exts) and full != abs_base:
-                                    collected.append(full)
-                    elif scope == "directory":
-                        try:
-                            for fname in os.listdir(base_dir):
-                                full = os.path.abspath(os.path.join(base_dir, fname))
-                                if os.path.isfile(full) and full.lower().endswith(rom_exts) and full != abs_base:
-                                    collected.append(full)
-                        except Exception:
-                            pass
-                    original = list(self.modified_rom)
-                    seen = set(os.path.abspath(x) for x in original)
-                    for f in collected:
-                        if os.path.abspath(f) not in seen:
-                            original.append(f)
-                            seen.add(os.path.abspath(f))
-                    self.modified_rom = original
+                    if scope in ("enable", "directory"):
+                        base_key = os.path.normcase(abs_base) if abs_base else None
+                        for full in iter_files_with_extensions(base_dir, ROM_SEARCH_EXTENSIONS,
+                                                               recurse=(scope == "enable"), skip_hidden=True):
+                            if os.path.normcase(full) != base_key:
+                                collected.append(full)
+                    self.modified_rom = merge_unique_paths(self.modified_rom, collected)
                 except Exception as e:
                     self.log_message(f"Search expansion error: {e}")
 
@@ -2443,10 +2749,9 @@ class AutoPatcherApp:
             # (2a) Immediately show hashes for the selected Modified ROMs (before Base ROM prompt).
             #     This ensures the Info/Output box populates right after the first dialog,
             #     matching the behavior of “Auto Patch Files” when expanded search is enabled.
-            for rom in self.modified_rom:
-                self.log_message(f"Selected Modified ROM file: {os.path.basename(rom)}")
-                self.display_modified_rom_hashes(rom)
-                self.log_message(f"Select the base ROM file.")
+            #     Hashing runs on a worker so the Base ROM dialog opens without waiting.
+            modified_hashes_done = self._display_modified_rom_hashes_async(list(self.modified_rom))
+            self.log_message(f"Select the base ROM file.")
 
             # (3) Pick the Base ROM second
             self.file_search_rom()
@@ -2454,18 +2759,18 @@ class AutoPatcherApp:
                 return
 
             # (4) Final clean-up: never allow Base==Modified; remove duplicates
-            abs_base = os.path.abspath(self.base_rom)
+            base_key = os.path.normcase(os.path.abspath(self.base_rom))
             cleaned = []
             seen = set()
             for _p in self.modified_rom:
-                ap = os.path.abspath(_p)
-                if ap == abs_base:
+                key = os.path.normcase(_p)
+                if key == base_key:
                     self.log_message("Error: Base ROM and Modified ROM cannot be the same file. Ignoring this one.")
                     continue
-                if ap in seen:
+                if key in seen:
                     continue
                 cleaned.append(_p)
-                seen.add(ap)
+                seen.add(key)
             self.modified_rom = cleaned
             if not self.modified_rom:
                 self.log_message("No valid Modified ROM files selected.")
@@ -2474,21 +2779,31 @@ class AutoPatcherApp:
             # (5) Log hashes so users can verify each Modified ROM
             # (5) Hashes already displayed earlier after first selection.
             # (6) Create patches in background
+            options = self._read_patch_options()
+            path_lines = []
             for rom in self.modified_rom:
-                ext = ".ips" if self.bps_ips_type.get() == ".ips" else ".bps"
                 rom_base = os.path.splitext(rom)[0]
-                patch_file_path = rom_base + ("_patched" if self.append_suffix.get() else "") + ext
+                patch_file_path = rom_base + ("_patched" if options["append_suffix"] else "") + options["patch_ext"]
                 log_operation_paths(
-                    self.log_message,
+                    path_lines.append,
                     patch_file_path=patch_file_path,
                     base_rom_path=self.base_rom,
                     modified_rom_path=rom,
                     output_file_path=patch_file_path,
                 )
+            self.log_messages(path_lines)
+
+            def _create_after_hash_display():
+                # Keep the Modified ROM hash blocks ahead of the creation output.
+                modified_hashes_done.wait()
+                self.create_patches(options)
 
             self.log_message("Patch creation process has started.")
             self.log_message("Note: for Nintendo 64 ROMs this will take time.")
-            Thread(target=self.create_patches, daemon=True).start()
+            self._run_background_patch_job(
+                _create_after_hash_display,
+                busy_message="A patching job is already running. Please wait for it to finish.",
+            )
     # ----- END C5: Start button logic --------------------------------------------
 
     # ----- START C6: “Utility …” helpers (moved) --------------------------------
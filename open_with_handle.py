@@ -17,9 +17,14 @@ How it integrates with the app:
 from __future__ import annotations
 import os
 import tkinter as tk
+from threading import Thread
 from tkinter import filedialog
 
-from utils import log_operation_paths
+from utils import log_operation_paths, iter_files_with_extensions, iter_unique_paths, merge_unique_paths, ROM_SEARCH_EXTENSIONS
+
+# Lowercase extensions (with the dot) used to route a file opened via "Open with".
+PATCH_EXTS = frozenset({".bps", ".ips"})
+ROM_EXTS = frozenset("." + ext for ext in ROM_SEARCH_EXTENSIONS)
 
 class OpenWithHandler:
     """Encapsulate all "Open with …" startup behavior for the GUI.
@@ -79,12 +84,16 @@ class OpenWithHandler:
                 output_file_path=output_path,
             )
 
-    def _log_pending_create_paths(self):
-        """Show the path block for the current create selection before the job starts."""
+    def _log_pending_create_paths(self, options):
+        """Show the path block for the current create selection before the job starts.
+
+        ``options`` is the app's ``_read_patch_options`` snapshot, so this also
+        runs safely from the queued job.
+        """
         app = self.app
         base_rom = getattr(app, "base_rom", None)
-        patch_ext = ".ips" if str(app.bps_ips_type.get()) == ".ips" else ".bps"
-        append_suffix = bool(app.append_suffix.get())
+        patch_ext = options["patch_ext"]
+        append_suffix = options["append_suffix"]
 
         for rom in list(getattr(app, "modified_rom", []) or []):
             rom_base = os.path.splitext(str(rom))[0]
@@ -97,6 +106,20 @@ class OpenWithHandler:
                 output_file_path=patch_file_path,
             )
 
+    def _queue_job(self, target):
+        """Run ``target`` (apply_patches/create_patches) off the Tk thread.
+
+        The app's long-lived job worker is reused when available, so Open-with
+        runs follow the same one-job-at-a-time rule as the Start button instead
+        of creating a fresh thread per launch.
+        """
+        app = self.app
+        starter = getattr(app, "_run_background_patch_job", None)
+        if callable(starter):
+            starter(target, busy_message="A patching job is already running. Please wait for it to finish.")
+        else:
+            Thread(target=target, daemon=True).start()
+
     # -------------------- Public entry point --------------------
     def handle_startup_file(self, file_path: str):
         """Route a startup file into the correct workflow.
@@ -109,14 +132,13 @@ class OpenWithHandler:
         3) Unknown extension        -> ask whether it should be treated as ROM or Patch
         """
         # Respond to OS 'Open with' action (when the user double-clicks or uses context menu).
-        ext = os.path.splitext(file_path)[1].lower()
-        patch_exts = {".bps", ".ips"}
-        rom_exts = {".nes", ".sfc", ".smc", ".gba", ".gbc", ".gen", ".md", ".bin", ".rom",
-                    ".z64", ".n64", ".v64", ".sms", ".pce"}
+        name = os.path.basename(file_path)
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if dot > 0 else ""
 
-        if ext in patch_exts:
+        if ext in PATCH_EXTS:
             self._start_patch_flow_with_preselected_patch(file_path, ext)
-        elif ext in rom_exts:
+        elif ext in ROM_EXTS:
             self._ask_base_or_modified(file_path)  # is it Base or Modified?
         else:
             self._ask_rom_or_patch(file_path)      # unknown → ask ROM vs Patch
@@ -151,13 +173,9 @@ class OpenWithHandler:
 
         # Start the patch job on a background thread so the GUI stays responsive.
         self._log_pending_apply_paths()
-        starter = getattr(app, "_start_background_job", None)
-        if callable(starter):
-            starter(app.apply_patches, busy_message="Patching process has started.")
-        else:
-            app.log_message("Patching process has started.")
-            from threading import Thread
-            Thread(target=app.apply_patches, daemon=True).start()
+        app.log_message("Patching process has started.")
+        options = app._read_patch_options()
+        self._queue_job(lambda: app.apply_patches(options))
 
 
     def _start_patch_flow_with_preselected_base_rom(self, base_path: str):
@@ -182,7 +200,7 @@ class OpenWithHandler:
             pass
 
         patch_ext = str(app.bps_ips_type.get()).lower()
-        filetypes = [('.BPS Patch Files', '*.bps'), ('All Files', '*.*')] if patch_ext == '.bps' else [('.IPS Patch Files', '*.ips'), ('All Files', '*.*')]
+        filetypes = app.patch_file_types['.bps' if patch_ext == '.bps' else '.ips']
         app.patch_files = filedialog.askopenfilenames(
             title='Select the Patch file (drag for multi-select).',
             filetypes=filetypes,
@@ -190,34 +208,17 @@ class OpenWithHandler:
         if not app.patch_files:
             app.log_message('No Patch Files selected.')
             return
+        app.patch_files = [os.path.abspath(p) for p in app.patch_files]
 
         try:
             scope = app.search_scope.get()
-            base_dir = os.path.dirname(os.path.abspath(app.patch_files[0]))
-            target_ext = '.bps' if patch_ext == '.bps' else '.ips'
+            base_dir = os.path.dirname(app.patch_files[0])
+            target_ext = 'bps' if patch_ext == '.bps' else 'ips'
             collected = []
-            if scope == 'enable':
-                for root, _, files in os.walk(base_dir):
-                    for fname in files:
-                        if fname.lower().endswith(target_ext):
-                            collected.append(os.path.join(root, fname))
-            elif scope == 'directory':
-                try:
-                    for fname in os.listdir(base_dir):
-                        full = os.path.join(base_dir, fname)
-                        if os.path.isfile(full) and fname.lower().endswith(target_ext):
-                            collected.append(full)
-                except Exception:
-                    pass
-
-            original = list(app.patch_files)
-            seen = set(os.path.abspath(x) for x in original)
-            for f in collected:
-                af = os.path.abspath(f)
-                if af not in seen:
-                    original.append(af)
-                    seen.add(af)
-            app.patch_files = original
+            if scope in ('enable', 'directory'):
+                collected = list(iter_files_with_extensions(base_dir, {target_ext},
+                                                            recurse=(scope == 'enable'), skip_hidden=True))
+            app.patch_files = merge_unique_paths(app.patch_files, collected)
         except Exception as e:
             app.log_message(f'Search expansion error: {e}')
             app.patch_files = list(app.patch_files)
@@ -230,13 +231,9 @@ class OpenWithHandler:
                 pass
 
         self._log_pending_apply_paths()
-        starter = getattr(app, "_start_background_job", None)
-        if callable(starter):
-            starter(app.apply_patches, busy_message='Patching process has started.')
-        else:
-            app.log_message('Patching process has started.')
-            from threading import Thread
-            Thread(target=app.apply_patches, daemon=True).start()
+        app.log_message('Patching process has started.')
+        options = app._read_patch_options()
+        self._queue_job(lambda: app.apply_patches(options))
 
     def _start_create_flow_with_preselected_base_rom(self, base_path: str):
         """Start Auto Create Patches mode when the startup file is the Base ROM.
@@ -269,82 +266,67 @@ class OpenWithHandler:
         if not modified:
             app.log_message("No Modified ROM file selected.")
             return
+        modified = [os.path.abspath(p) for p in modified]
+        base_key = os.path.normcase(app.base_rom)
+
+        # A ROM cannot be both the Base ROM and the Modified ROM in the same
+        # patch-creation operation. Only files the user picked are reported;
+        # the scan below silently skips the Base ROM.
+        picked = []
+        for _p in modified:
+            if os.path.normcase(_p) == base_key:
+                app.log_message("Error: Base ROM and Modified ROM cannot be the same file. Ignoring this one.")
+            else:
+                picked.append(_p)
 
         # Expand the list according to the current search_scope setting.
         #
         # search_scope == "enable"   -> walk subfolders too
         # search_scope == "directory"-> only inspect the current folder
         # anything else               -> use exactly what the user selected
+        scan = iter(())
         try:
             scope = app.search_scope.get()
-            base_dir = os.path.dirname(os.path.abspath(modified[0]))
-            rom_exts = (".nes", ".sfc", ".smc", ".gba", ".gbc", ".gen", ".md", ".bin",
-                        ".rom", ".z64", ".n64", ".v64", ".sms", ".pce")
-            collected = []
-            abs_base = os.path.abspath(app.base_rom)
-            if scope == "enable":
-                for root, _, files in os.walk(base_dir):
-                    for fname in files:
-                        full = os.path.abspath(os.path.join(root, fname))
-                        if full.lower().endswith(rom_exts) and full != abs_base:
-                            collected.append(full)
-            elif scope == "directory":
-                try:
-                    for fname in os.listdir(base_dir):
-                        full = os.path.abspath(os.path.join(base_dir, fname))
-                        if os.path.isfile(full) and full.lower().endswith(rom_exts) and full != abs_base:
-                            collected.append(full)
-                except Exception:
-                    pass
-            original = list(modified)
-            seen = set(os.path.abspath(x) for x in original)
-            for f in collected:
-                if os.path.abspath(f) not in seen:
-                    original.append(f)
-                    seen.add(os.path.abspath(f))
-            app.modified_rom = original
+            base_dir = os.path.dirname(modified[0])
+            if scope in ("enable", "directory"):
+                scan = iter_files_with_extensions(base_dir, ROM_SEARCH_EXTENSIONS,
+                                                  recurse=(scope == "enable"), skip_hidden=True)
         except Exception as e:
             app.log_message(f"Search expansion error: {e}")
-            app.modified_rom = list(modified)
 
-        # Remove impossible / duplicate entries.
-        # A ROM cannot be both the Base ROM and the Modified ROM in the same
-        # patch-creation operation.
-        abs_base = os.path.abspath(app.base_rom)
-        cleaned = []
-        seen = set()
-        for _p in app.modified_rom:
-            ap = os.path.abspath(_p)
-            if ap == abs_base:
-                app.log_message("Error: Base ROM and Modified ROM cannot be the same file. Ignoring this one.")
-                continue
-            if ap in seen:
-                continue
-            cleaned.append(_p)
-            seen.add(ap)
-        app.modified_rom = cleaned
-        if not app.modified_rom:
-            app.log_message("No Modified ROM file selected.")
-            return
+        # Picked files first, then the scan results, in the order they are hashed.
+        kept = []
 
-        for rom in app.modified_rom:
-            # Log each selected modified ROM and then display its hashes so the
-            # user can verify they picked the intended file.
-            app.log_message(f"Select the Modified ROM file: {os.path.basename(rom)}")
+        def _unique_roms():
+            """Yield each Modified ROM once; consumed on the hash worker, so the scan overlaps hashing."""
             try:
-                app.display_modified_rom_hashes(rom)
-            except Exception:
-                pass
-
-        self._log_pending_create_paths()
-        app.log_message("Patch creation process has started.")
-        app.log_message("Note: for Nintendo 64 ROMs this will take time.")
-        starter = getattr(app, "_start_background_job", None)
-        if callable(starter):
-            starter(app.create_patches, busy_message="Patch creation process has started.")
-        else:
-            from threading import Thread
-            Thread(target=app.create_patches, daemon=True).start()
+                for _p in iter_unique_paths(picked, scan):
+                    if os.path.normcase(_p) != base_key:
+                        kept.append(_p)
+                        yield _p
+            except Exception as e:
+                app.log_message(f"Search expansion error: {e}")
+
+        # Log each Modified ROM and its hashes so the user can verify they
+        # picked the intended files, without blocking the Tk thread.
+        hashes_done = app._display_modified_rom_hashes_async(_unique_roms())
+
+        # Read on the Tk thread; the job below only uses the snapshot.
+        options = app._read_patch_options()
+
+        def _create_after_hash_display():
+            # The hash worker also runs the scan that fills ``kept``.
+            hashes_done.wait()
+            app.modified_rom = list(kept)
+            if not app.modified_rom:
+                app.log_message("No Modified ROM file selected.")
+                return
+            self._log_pending_create_paths(options)
+            app.log_message("Patch creation process has started.")
+            app.log_message("Note: for Nintendo 64 ROMs this will take time.")
+            app.create_patches(options)
+
+        self._queue_job(_create_after_hash_display)
 
     def _start_create_flow_with_preselected_modified_rom(self, mod_path: str):
         """Start Auto Create Patches mode when the startup file is the Modified ROM.
@@ -369,15 +351,11 @@ class OpenWithHandler:
         if not app.base_rom:
             return
 
-        self._log_pending_create_paths()
+        options = app._read_patch_options()
+        self._log_pending_create_paths(options)
         app.log_message("Patch creation process has started.")
         app.log_message("Note: for Nintendo 64 ROMs this will take time.")
-        starter = getattr(app, "_start_background_job", None)
-        if callable(starter):
-            starter(app.create_patches, busy_message="Patch creation process has started.")
-        else:
-            from threading import Thread
-            Thread(target=app.create_patches, daemon=True).start()
+        self._queue_job(lambda: app.create_patches(options))
 
     # ------------------------------------------------------------------
     # Small helper dialogs
@@ -385,60 +363,41 @@ class OpenWithHandler:
     # These dialogs only decide *how to route* the startup file. They do not
     # perform the actual patching work themselves.
 
-    # First Open-With dialog window.
-    def _ask_rom_or_patch(self, file_path: str):
-        """Ask the user whether an unknown startup file should be treated as ROM or Patch."""
+    # Both routing dialogs share one builder. Each prompt is shown at most once
+    # per launch, so the window is destroyed as soon as a choice is made.
+    def _show_choice_dialog(self, file_path: str, *, title: str, text: str,
+                            minsize: tuple, choices: list, on_close):
+        """Show a two-choice routing dialog for ``file_path``.
+
+        ``choices`` holds (button label, callback) pairs and ``on_close`` runs when
+        the window is closed; every callback receives ``file_path``.
+        """
         app = self.app
         dlg = tk.Toplevel(app.root)
-        dlg.title("Is this file a ROM or Patch?")
+        dlg.title(title)
         try:
             if self.icon_path: dlg.iconbitmap(self.icon_path)
         except Exception: pass
         dlg.transient(app.root)
-        dlg.grab_set()
         dlg.resizable(True, True)
-        dlg.minsize(400, 200)
-
-        tk.Label(
-            dlg,
-            text=("Is the file a ROM or a Patch?\n\n"
-                  "Choose “ROM” to create a patch (you'll select Modified ROMs next),\n"
-                  "or “Patch” to apply a patch (you'll select the Base ROM next)."),
-            justify="left", padx=14, pady=10
-        ).pack(anchor="w")
+        dlg.minsize(*minsize)
 
+        tk.Label(dlg, text=text, justify="left", padx=14, pady=10).pack(anchor="w")
         btns = tk.Frame(dlg); btns.pack(pady=(6, 10))
 
-        # Button callbacks are nested here because they only matter to this
-        # one dialog instance.
-        def _choose_rom():
-            """_choose_rom helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: self._ask_base_or_modified(file_path)
+        def _command(callback):
+            """Wrap ``callback`` so the dialog is destroyed before the chosen flow starts."""
+            def _run():
+                try: dlg.destroy()
+                finally: callback(file_path)
+            return _run
 
-        def _choose_patch():
-            """_choose_patch helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: self._start_patch_flow_with_preselected_patch(file_path, ".bps")
-
-        def _on_close():
-            """_on_close helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: app.log_message("No valid ROM or Patch file selected.")
-
-        tk.Button(btns, text="ROM", width=12, command=_choose_rom).pack(side="left", padx=6)
-        tk.Button(btns, text="Patch", width=12, command=_choose_patch).pack(side="left", padx=6)
-        dlg.protocol("WM_DELETE_WINDOW", _on_close)
+        for label, callback in choices:
+            tk.Button(btns, text=label, width=12, command=_command(callback)).pack(side="left", padx=6)
+        dlg.protocol("WM_DELETE_WINDOW", _command(on_close))
 
+        dlg.lift()
+        dlg.grab_set()
         try:
             app.root.update_idletasks()
             x = app.root.winfo_rootx() + 60
@@ -447,58 +406,34 @@ class OpenWithHandler:
         except Exception:
             pass
 
+    # First Open-With dialog window.
+    def _ask_rom_or_patch(self, file_path: str):
+        """Ask the user whether an unknown startup file should be treated as ROM or Patch."""
+        self._show_choice_dialog(
+            file_path,
+            title="Is this file a ROM or Patch?",
+            text=("Is the file a ROM or a Patch?\n\n"
+                  "Choose “ROM” to create a patch (you'll select Modified ROMs next),\n"
+                  "or “Patch” to apply a patch (you'll select the Base ROM next)."),
+            minsize=(400, 200),
+            choices=[
+                ("ROM", self._ask_base_or_modified),
+                ("Patch", lambda path: self._start_patch_flow_with_preselected_patch(path, ".bps")),
+            ],
+            on_close=lambda path: self.app.log_message("No valid ROM or Patch file selected."),
+        )
+
     # Second Open-With dialog window.
     def _ask_base_or_modified(self, file_path: str):
         """Ask whether a ROM file should be treated as Base ROM or Modified ROM."""
-        app = self.app
-        dlg = tk.Toplevel(app.root)
-        dlg.title("Is this file a Base ROM or a Modified ROM?")
-        try:
-            if self.icon_path: dlg.iconbitmap(self.icon_path)
-        except Exception: pass
-        dlg.transient(app.root)
-        dlg.grab_set()
-        dlg.resizable(True, True)
-        dlg.minsize(400, 80)
-
-        tk.Label(dlg, text="Selecting \"Base ROM\" puts you in Patching Mode.\nSelecting \"Modified ROM\" puts you into Patch Create Mode.",
-            justify="left",
-            padx=14, pady=10).pack(anchor="w")
-
-        btns = tk.Frame(dlg); btns.pack(pady=(6, 10))
-
-        def _choose_base():
-            """_choose_base helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: self._start_patch_flow_with_preselected_base_rom(file_path)
-
-        def _choose_modified():
-            """_choose_modified helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: self._start_create_flow_with_preselected_modified_rom(file_path)
-
-        def _on_close():
-            """_on_close helper.
-
-            Guidance: keep inputs validated, prefer existing shared helpers, and log user-visible status through the current workflow logger when appropriate.
-            """
-            try: dlg.destroy()
-            finally: app.log_message("No action or change occured.")
-
-        tk.Button(btns, text="Base ROM", width=12, command=_choose_base).pack(side="left", padx=6)
-        tk.Button(btns, text="Modified ROM", width=12, command=_choose_modified).pack(side="left", padx=6)
-        dlg.protocol("WM_DELETE_WINDOW", _on_close)
-
-        try:
-            app.root.update_idletasks()
-            x = app.root.winfo_rootx() + 60
-            y = app.root.winfo_rooty() + 60
-            dlg.geometry(f"+{x}+{y}")
-        except Exception:
-            pass
+        self._show_choice_dialog(
+            file_path,
+            title="Is this file a Base ROM or a Modified ROM?",
+            text="Selecting \"Base ROM\" puts you in Patching Mode.\nSelecting \"Modified ROM\" puts you into Patch Create Mode.",
+            minsize=(400, 80),
+            choices=[
+                ("Base ROM", self._start_patch_flow_with_preselected_base_rom),
+                ("Modified ROM", self._start_create_flow_with_preselected_modified_rom),
+            ],
+            on_close=lambda path: self.app.log_message("No action or change occured."),
+        )
@@ -1,52 +1,176 @@
 """Shared utility helpers for Flips Auto Patcher."""
 
 import os
-import binascii
-import hashlib
+import queue
 import struct
 import base64
 import re
+from functools import lru_cache
 from typing import Optional, Callable
 
 
+# Read size used when streaming ROM and patch files through the hash helpers.
+# ROMs are often tens of MB, so large reads keep the Python loop overhead low.
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files up to this size are memory-mapped and hashed in a single C call.
+# Anything larger falls back to HASH_CHUNK_SIZE reads.
+HASH_MMAP_MAX_SIZE = 512 << 20
+
+# Memory-mapped files at least this large have MD5 and SHA-1 computed on worker
+# threads (hashlib and zlib release the GIL) while CRC32 runs on the caller.
+HASH_PARALLEL_MIN_SIZE = 8 << 20
+
+# Bytes read from the start of a BPS patch to decode its header fields.
+BPS_HEADER_READ_SIZE = 64
+
+# Source and target CRC32 at the start of the 12-byte BPS footer (little-endian).
+_FOOTER_STRUCT = struct.Struct('<II')
+
+
+_crc32_func = None
+
+
+def _crc32_impl():
+    """Return the ``crc32`` function used by the hash helpers.
+
+    Prefers the optional ``zlib-ng`` package (folded CRC32 with PCLMULQDQ/ARMv8
+    CRC instructions) and falls back to the standard library ``zlib``. Both give
+    the same IEEE CRC32 values and accept a running value as the second argument.
+    The choice is made once, so a missing ``zlib-ng`` is not re-imported per file.
+
+    Hardware CRC32C (Castagnoli) is not an option here: every CRC this app shows
+    or compares must equal the IEEE CRC32 in BPS footers and ROM databases, and
+    the hash cache is keyed on path/mtime/size rather than a content fingerprint.
+    """
+    global _crc32_func
+    if _crc32_func is None:
+        try:
+            from zlib_ng import zlib_ng as zlib
+        except Exception:
+            import zlib
+        _crc32_func = zlib.crc32
+    return _crc32_func
+
+
+_hash_factories = {}
+
+
+def _hash_factory(name):
+    """Return a no-argument constructor for the hashlib algorithm ``name``.
+
+    The hashes are only used to identify files, so ``usedforsecurity=False`` is
+    passed where supported (Python 3.9+); FIPS-restricted OpenSSL builds would
+    otherwise refuse MD5.
+    """
+    factory = _hash_factories.get(name)
+    if factory is None:
+        import hashlib
+        from functools import partial
+
+        constructor = getattr(hashlib, name)
+        try:
+            constructor(usedforsecurity=False)
+            factory = partial(constructor, usedforsecurity=False)
+        except TypeError:
+            factory = constructor
+        _hash_factories[name] = factory
+    return factory
+
+
+def _iter_file_buffers(file_path):
+    """Yield the file contents as one read-only memory map, or as 1 MiB chunks.
+
+    Mapping the file lets zlib/hashlib walk the whole ROM in one call instead of
+    thousands of ``read()`` calls. Empty or very large files, and handles that
+    reject ``mmap``, fall back to plain chunked reads.
+    """
+    with open(file_path, 'rb', buffering=HASH_CHUNK_SIZE) as f:
+        yield from _iter_open_file_buffers(f)
+
+
+def _iter_open_file_buffers(f):
+    """Like ``_iter_file_buffers`` but for a binary file already open at offset 0.
+
+    Lets a caller that has to read other parts of the file (such as the BPS
+    footer) hash it through the same handle instead of opening it again.
+    """
+    import mmap
+
+    mm = None
+    try:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= HASH_MMAP_MAX_SIZE:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        mm = None
+
+    if mm is not None:
+        # Hashing is one front-to-back pass, so ask for aggressive read-ahead.
+        # madvise/MADV_SEQUENTIAL are missing on Windows and older Pythons.
+        try:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass
+
+    if mm is not None:
+        with mm:
+            yield mm
+        return
+
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+        yield chunk
+
+
 # Function to calculate CRC32 of a file
 def calculate_crc32(file_path):
-    """Stream the file in chunks and return its CRC32 checksum as an unsigned integer.
+    """Hash the file (memory-mapped or chunked) and return its CRC32 as an unsigned integer.
 
     This is the fast integrity hash used throughout the patch workflow for ROM and
     patch verification, especially when matching BPS source and target data.
     """
+    crc32_update = _crc32_impl()
+
     crc32 = 0
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(65536):
-            crc32 = binascii.crc32(chunk, crc32)
+    for chunk in _iter_file_buffers(file_path):
+        crc32 = crc32_update(chunk, crc32)
     return crc32 & 0xFFFFFFFF
 
+def _file_hexdigest(file_path, new_hash):
+    """Return the hex digest of a file for a hash constructor from ``_hash_factory``.
+
+    On Python 3.11+ ``hashlib.file_digest`` runs the whole read/update loop in C
+    with the GIL released. Older Pythons hash the memory-mapped or chunked buffers.
+    """
+    import hashlib
+
+    file_digest = getattr(hashlib, 'file_digest', None)
+    if file_digest is not None:
+        with open(file_path, 'rb', buffering=0) as f:
+            return file_digest(f, new_hash).hexdigest()
+
+    hash_obj = new_hash()
+    for chunk in _iter_file_buffers(file_path):
+        hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
 # Function to calculate MD5 of a file
 def calculate_md5(file_path):
-    """Read the file in chunks and return its MD5 digest as a lowercase hex string.
+    """Hash the file and return its MD5 digest as a lowercase hex string.
 
     MD5 is shown in the UI as additional verification information for users who want
     to compare files against known hashes from patch notes or ROM databases.
     """
-    md5_hash = hashlib.md5()
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(65536):
-            md5_hash.update(chunk)
-    return md5_hash.hexdigest()
+    return _file_hexdigest(file_path, _hash_factory('md5'))
 
 # Function to calculate SHA-1 of a file
 def calculate_sha1(file_path):
-    """Read the file in chunks and return its SHA-1 digest as a lowercase hex string.
+    """Hash the file and return its SHA-1 digest as a lowercase hex string.
 
     SHA-1 is logged alongside CRC32 and MD5 so the app can display a fuller set of
     hash values for ROM and patch identification.
     """
-    sha1_hash = hashlib.sha1()
-    with open(file_path, 'rb') as f:
-        while chunk := f.read(65536):
-            sha1_hash.update(chunk)
-    return sha1_hash.hexdigest()
+    return _file_hexdigest(file_path, _hash_factory('sha1'))
 
 # Function to calculate the ZLE hash
 def calculate_zle_hash(file_path):
@@ -55,44 +179,126 @@ def calculate_zle_hash(file_path):
     This is mainly useful for N64 workflows where users expect the same short ZLE
     value shown by other ROM tools when comparing variants.
     """
-    with open(file_path, 'rb') as f:
-        rom_content = f.read()
-    zle_value = rom_content[16:28]
+    # Unbuffered, so only the 28 header bytes are read instead of a full buffer.
+    with open(file_path, 'rb', buffering=0) as f:
+        # Only bytes 16..27 are used; do not pull the whole ROM in for them.
+        first28 = f.read(28)
+    return _zle_from_bytes(first28[16:28])
+
+@lru_cache(maxsize=1024)
+def _zle_from_bytes(zle_value):
+    """Format the ZLE region (ROM bytes 16..27) as the trimmed hex text shown in the UI.
+
+    Cached on the raw bytes, so re-displaying the same ROMs skips the formatting.
+    """
     return zle_value.hex().rstrip('0')
 
+# Function to calculate every displayed hash in one pass
+def calculate_all_hashes(file_path):
+    """Read the file once and return its CRC32, MD5, SHA-1 and ZLE values together.
+
+    The Info/Output box shows all four values for each ROM or patch, so feeding
+    every chunk to each hasher avoids reading the same large file four times.
+    Returns a dict with ``crc32`` (int), ``md5``, ``sha1`` and ``zle`` (hex text).
+    """
+    return _hash_all_buffers(_iter_file_buffers(file_path))
+
+def _hash_all_buffers(buffers):
+    """Feed every buffer to CRC32, MD5 and SHA-1 and return the ``calculate_all_hashes`` dict."""
+    crc32_update = _crc32_impl()
+    crc32 = 0
+    md5_hash = _hash_factory('md5')()
+    sha1_hash = _hash_factory('sha1')()
+    first28 = None
+    for chunk in buffers:
+        if first28 is None:
+            # Copy the header bytes out before the map can be closed by the caller.
+            first28 = bytes(chunk[:28])
+        if not isinstance(chunk, bytes) and len(chunk) >= HASH_PARALLEL_MIN_SIZE:
+            # The whole file is one shared read-only map, so the three hashes can
+            # walk it at the same time without copying it per thread.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                md5_done = pool.submit(md5_hash.update, chunk)
+                sha1_done = pool.submit(sha1_hash.update, chunk)
+                crc32 = crc32_update(chunk, crc32)
+                md5_done.result()
+                sha1_done.result()
+            continue
+        crc32 = crc32_update(chunk, crc32)
+        md5_hash.update(chunk)
+        sha1_hash.update(chunk)
+    return {
+        'crc32': crc32 & 0xFFFFFFFF,
+        'md5': md5_hash.hexdigest(),
+        'sha1': sha1_hash.hexdigest(),
+        'zle': _zle_from_bytes(first28[16:28]) if first28 else '',
+    }
+
+def get_patch_footer(patch_file_path):
+    """Return only the Source/Target CRC32 stored in a BPS patch's 12-byte footer.
+
+    This is a single small read at the end of the file, so callers that only need
+    to match a patch against a Base ROM can skip the full-file hash pass that
+    ``get_patch_metadata`` does. Returns None when the footer cannot be read.
+    """
+    try:
+        with open(patch_file_path, 'rb') as f:
+            return _read_bps_footer(f)
+    except Exception:
+        return None
+
+
+def _read_bps_footer(f):
+    """Read the Source/Target CRC32 from the footer of an open BPS patch file."""
+    f.seek(-12, os.SEEK_END)
+    source_crc32, target_crc32 = _FOOTER_STRUCT.unpack(f.read(_FOOTER_STRUCT.size))
+    return {
+        "Source CRC32": f"{source_crc32:#010x}",
+        "Target CRC32": f"{target_crc32:#010x}",
+    }
+
+
 # Function to retrieve metadata from a .bps patch file
-def get_patch_metadata(patch_file_path):
+def get_patch_metadata_full(patch_file_path):
     """Read a BPS patch and return the hashes and embedded source/target CRC values.
 
     The returned dictionary feeds the Info/Output area so users can see both the
     patch file hashes and the source/target CRC32 values stored inside the patch.
+    This hashes the whole patch; use ``get_patch_footer`` when only the embedded
+    CRCs are needed.
     """
     try:
-        with open(patch_file_path, 'rb') as f:
-            crc32 = calculate_crc32(patch_file_path)
-            md5 = calculate_md5(patch_file_path)
-            sha1 = calculate_sha1(patch_file_path)
-            zle = calculate_zle_hash(patch_file_path)
-            f.seek(-12, os.SEEK_END)
-            source_crc32, target_crc32 = struct.unpack('<II', f.read(8))
-            return {
-                "CRC32": f"{crc32:#010x}",
-                "MD5": md5,
-                "SHA-1": sha1,
-                "ZLE": zle,
-                "Source CRC32": f"{source_crc32:#010x}",
-                "Target CRC32": f"{target_crc32:#010x}"
-            }
+        # One handle serves both reads. The CRCs live in the 12-byte footer; read
+        # that before the hash pass, so a truncated file fails without hashing it.
+        with open(patch_file_path, 'rb', buffering=HASH_CHUNK_SIZE) as f:
+            footer = _read_bps_footer(f)
+            f.seek(0)
+            # One pass over the patch feeds CRC32, MD5, SHA-1 and ZLE together.
+            hashes = _hash_all_buffers(_iter_open_file_buffers(f))
+        return {
+            "CRC32": f"{hashes['crc32']:#010x}",
+            "MD5": hashes['md5'],
+            "SHA-1": hashes['sha1'],
+            "ZLE": hashes['zle'],
+            **footer,
+        }
     except Exception as e:
         print(f"Error reading patch file {patch_file_path}: {e}")
         return None
 
 
+# Existing name for the full metadata read, used throughout the app.
+get_patch_metadata = get_patch_metadata_full
+
+
 def get_bps_source_size(patch_file_path):
     """Return the embedded BPS source size in bytes, or None on failure."""
     try:
         with open(patch_file_path, 'rb') as f:
-            data = f.read()
+            # "BPS1" + one varint: a 64-bit size needs at most 10 bytes.
+            data = f.read(BPS_HEADER_READ_SIZE)
     except Exception:
         return None
 
@@ -228,9 +434,13 @@ def get_ips_details(patch_file_path):
     return details
 
 
-def get_ips_requirements(patch_file_path):
-    """Return (min_required_size_bytes, truncate_size_bytes_or_None, record_count)."""
-    details = get_ips_details(patch_file_path)
+def get_ips_requirements(patch_file_path, details=None):
+    """Return (min_required_size_bytes, truncate_size_bytes_or_None, record_count).
+
+    Pass ``details`` from an earlier ``get_ips_details`` call to skip re-parsing.
+    """
+    if details is None:
+        details = get_ips_details(patch_file_path)
     return (
         int(details.get('min_required_size') or 0),
         details.get('truncate_size'),
@@ -446,16 +656,25 @@ def rewrite_rom_file_with_header_options(
 # ROM extension helpers
 # ------------------------------
 
+# Suffixes that mark a bare file name (no directory part) as a ROM path.
+_ROM_NAME_SUFFIXES = frozenset({
+    '.nes', '.fds', '.unf', '.unif', '.sfc', '.smc', '.fig', '.gba', '.agb',
+    '.gb', '.gbc', '.cgb', '.z64', '.n64', '.v64',
+})
+
+
 def normalize_rom_extension(ext_or_path):
     """Normalize a ROM filename or extension into the lowercase extension token the app uses.
 
     This keeps extension-based lookups consistent whether the caller passes a full
     path like ``game.sfc`` or just an extension like ``.sfc``.
     """
+    text = str(ext_or_path)
     try:
-        ext = os.path.splitext(str(ext_or_path))[1] if os.path.sep in str(ext_or_path) or str(ext_or_path).endswith(tuple('.'+x for x in ['nes','fds','unf','unif','sfc','smc','fig','gba','agb','gb','gbc','cgb','z64','n64','v64'])) else str(ext_or_path)
+        suffix = os.path.splitext(text)[1]
+        ext = suffix if os.path.sep in text or suffix in _ROM_NAME_SUFFIXES else text
     except Exception:
-        ext = str(ext_or_path)
+        ext = text
     ext = str(ext or '').strip().lower()
     if ext.startswith('.'):
         ext = ext[1:]
@@ -464,6 +683,88 @@ def normalize_rom_extension(ext_or_path):
 
 
 
+# ------------------------------
+# Expanded file search helpers
+# ------------------------------
+
+# ROM extensions picked up by the expanded file search (lowercase, no dot).
+ROM_SEARCH_EXTENSIONS = frozenset({
+    "nes", "sfc", "smc", "gba", "gbc", "gen", "md", "bin", "rom",
+    "z64", "n64", "v64", "sms", "pce",
+})
+
+
+def _is_hidden_dir_entry(entry):
+    """Return True for dot-folders and, on Windows, folders with the hidden attribute."""
+    if entry.name.startswith('.'):
+        return True
+    if os.name == 'nt':
+        # Windows fills DirEntry.stat() from the directory listing, so this is free.
+        import stat
+        attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+        return bool(attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+    return False
+
+
+def iter_files_with_extensions(base_dir, extensions, *, recurse=False, skip_hidden=False):
+    """Yield paths of files in ``base_dir`` whose extension is in ``extensions``.
+
+    ``extensions`` holds lowercase extensions without the dot. ``os.scandir``
+    entries carry their file/dir type from the directory listing, so this avoids
+    the extra ``stat`` per file that ``os.path.isfile`` costs. With ``recurse``
+    subfolders are walked top-down; unreadable folders are skipped like ``os.walk``.
+    The name is checked before the entry type, so on filesystems that do not
+    report types in the listing only matching names and (when recursing)
+    folders cost a ``stat``. ``skip_hidden`` leaves hidden subfolders out of
+    the walk (``base_dir`` itself is always listed).
+    """
+    pending = [base_dir]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                _, dot, ext = entry.name.rpartition('.')
+                if dot and ext.lower() in extensions and entry.is_file():
+                    yield entry.path
+                elif recurse and entry.is_dir(follow_symlinks=False):
+                    if skip_hidden and _is_hidden_dir_entry(entry):
+                        continue
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+        pending.extend(reversed(subdirs))
+
+
+def iter_unique_paths(paths, extra=()):
+    """Yield ``paths`` and then ``extra``, skipping entries that were already yielded.
+
+    Entries are compared by ``os.path.normcase``, so on Windows a path that only
+    differs in case counts as the same file. Both sides must already be absolute:
+    picked files are passed through ``os.path.abspath`` and
+    ``iter_files_with_extensions`` builds its paths from an absolute ``base_dir``.
+    Either side may be a generator (for example a live folder scan).
+    """
+    seen = set()
+    for group in (paths, extra):
+        for path in group:
+            key = os.path.normcase(path)
+            if key not in seen:
+                seen.add(key)
+                yield path
+
+
+def merge_unique_paths(paths, extra):
+    """Return the list form of ``iter_unique_paths(paths, extra)``."""
+    return list(iter_unique_paths(paths, extra))
+
+
 # ------------------------------
 # BPS family / console display helpers
 # ------------------------------
@@ -513,7 +814,7 @@ def get_rom_family_display(rom_path):
         pass
     return family
 
-def validate_ips_base_rom(patch_file_path, base_rom_path):
+def validate_ips_base_rom(patch_file_path, base_rom_path, details=None):
     """Return (ok, reason, details) for an IPS/base-ROM pairing.
 
     IPS has no embedded source checksum, so validation here is intentionally
@@ -523,8 +824,11 @@ def validate_ips_base_rom(patch_file_path, base_rom_path):
       2) when the patch carries a 3-byte truncate size, require the ROM size to
          match that expected size exactly
       3) reject malformed IPS files before any patch attempt starts
+
+    Pass ``details`` from an earlier ``get_ips_details`` call to check several
+    ROMs against one parse; it is copied, not modified.
     """
-    details = get_ips_details(patch_file_path)
+    details = dict(details) if details is not None else get_ips_details(patch_file_path)
     try:
         rom_size = int(os.path.getsize(base_rom_path))
     except Exception:
@@ -548,17 +852,14 @@ def validate_ips_base_rom(patch_file_path, base_rom_path):
 def get_ips_metadata(patch_file_path):
     """Return a metadata dict for IPS patches (hashes + IPS-only structural fields)."""
     try:
-        crc32 = calculate_crc32(patch_file_path)
-        md5 = calculate_md5(patch_file_path)
-        sha1 = calculate_sha1(patch_file_path)
-        zle = calculate_zle_hash(patch_file_path)
+        hashes = calculate_all_hashes(patch_file_path)
         details = get_ips_details(patch_file_path)
 
         meta = {
-            "CRC32": f"{crc32:#010x}",
-            "MD5": md5,
-            "SHA-1": sha1,
-            "ZLE": zle,
+            "CRC32": f"{hashes['crc32']:#010x}",
+            "MD5": hashes['md5'],
+            "SHA-1": hashes['sha1'],
+            "ZLE": hashes['zle'],
             "Min Required Size": str(int(details.get('min_required_size') or 0)),
             "Record Count": str(int(details.get('record_count') or 0)),
             "RLE Records": str(int(details.get('rle_record_count') or 0)),
@@ -617,18 +918,51 @@ def log_patch_requirements(log_fn: Optional[Callable[[str], None]], patch_file_p
     return
 
 
+# ------------------------------
+# flips.exe helpers
+# ------------------------------
+
+def run_flips(command):
+    """Run one flips.exe command and raise ``CalledProcessError`` when it fails.
+
+    stderr is folded into stdout so only one pipe is read. ``communicate`` can then
+    read it directly instead of starting reader threads (Windows) or a selector
+    loop (POSIX) for two pipes. The raw bytes are only decoded by
+    ``flips_output_text`` on the error path.
+
+    On Windows no console window is created per call. On POSIX ``close_fds=False``
+    lets CPython use ``posix_spawn``/``vfork``; Python's own descriptors are
+    non-inheritable, so nothing extra leaks into flips.
+    """
+    import subprocess
+
+    if os.name == "nt":
+        spawn_kwargs = {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)}
+    else:
+        spawn_kwargs = {"close_fds": False}
+    return subprocess.run(
+        command, check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **spawn_kwargs
+    )
+
+
+def flips_output_text(error) -> str:
+    """Return the combined flips.exe output captured on a ``CalledProcessError``."""
+    return (getattr(error, "stdout", None) or b"").decode("utf-8", "replace").strip()
+
+
 # ------------------------------
 # GUI logging helpers (Tkinter)
 # ------------------------------
 # Centralized, buffered writer for the Info/Output box.
 # - Prevents double-blank-line spam
 # - Batches inserts to reduce redraw overhead in bulk operations
+# - Accepts writes from worker threads; only the Tk thread touches the widget
 
 
 class GUILogger:
     """Buffered writer for the Info/Output box."""
 
-    def __init__(self, widget, *, max_lines=6000, flush_ms=25):
+    def __init__(self, widget, *, max_lines=5000, trim_to_lines=4000, flush_ms=50):
         """Set up the buffered GUI logger and define the line patterns that create spacing.
 
         The logger queues text, normalizes repeated status formats, and inserts blank
@@ -636,9 +970,13 @@ class GUILogger:
         """
         self.widget = widget
         self.max_lines = int(max_lines)
+        # Trim back well below the cap so the delete runs once per ~1000 lines,
+        # not on every flush once the box is full.
+        self.trim_to_lines = min(int(trim_to_lines), self.max_lines)
         self.flush_ms = int(flush_ms)
         self._queue = []
-        self._scheduled = False
+        # Raw (messages, section) pairs from any thread; drained on the Tk thread.
+        self._pending = queue.SimpleQueue()
         self._last_blank = False
 
         # ------------------------------------------------------------------
@@ -781,20 +1119,35 @@ class GUILogger:
         self._after_blank_contains = (
         )
 
+        # Start the Tk-thread pump. If the widget cannot schedule callbacks,
+        # write() falls back to flushing immediately.
+        try:
+            self.widget.after(self.flush_ms, self._pump)
+            self._pumping = True
+        except Exception:
+            self._pumping = False
+
     def write(self, message, *, section=None):
         """Queue one message for display and optionally add a section heading first.
 
         Messages are buffered instead of written immediately so bursts of logging do
         not make the Tk text widget flicker or update excessively.
         """
-        msg = "" if message is None else str(message)
+        self.write_lines((message,), section=section)
 
-        if section:
-            self._enqueue("")
-            self._enqueue(f"=== {section} ===")
+    def write_lines(self, messages, *, section=None):
+        """Queue several messages as one block that other threads cannot interleave with.
 
-        self._enqueue(msg)
-        self._schedule()
+        Used for multi-line reports such as a ROM's hash list or one patch job's
+        output, so the block reaches the widget in a single flush.
+        """
+        msgs = tuple("" if m is None else str(m) for m in messages)
+
+        # Safe from any thread: the messages are only handed to the pump here.
+        self._pending.put((msgs, section))
+        if not self._pumping:
+            self._drain()
+            self.flush()
 
     def _format_line(self, raw: str) -> str:
         """Normalize well-known status lines into the aligned display format used by the UI.
@@ -894,20 +1247,36 @@ class GUILogger:
                 self._queue.append("")
                 self._last_blank = True
 
-    def _schedule(self):
-        """Request a deferred flush on the Tk event loop if one is not already pending.
+    def _drain(self):
+        """Move every message queued by write() through the formatting rules.
 
-        Scheduling a batched flush keeps GUI updates responsive while avoiding one
-        widget write per individual log message.
+        Only the Tk thread calls this, so ``_queue`` and ``_last_blank`` are never
+        touched by worker threads.
         """
-        if self._scheduled:
-            return
-        self._scheduled = True
+        while True:
+            try:
+                msgs, section = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            if section:
+                self._enqueue("")
+                self._enqueue(f"=== {section} ===")
+            for msg in msgs:
+                self._enqueue(msg)
+
+    def _pump(self):
+        """Drain pending messages, flush them to the widget, and re-arm the timer.
+
+        Running on a fixed ``flush_ms`` timer caps widget updates (20 Hz by default)
+        no matter how quickly worker threads log.
+        """
+        self._drain()
+        self.flush()
         try:
-            self.widget.after(self.flush_ms, self.flush)
+            self.widget.after(self.flush_ms, self._pump)
         except Exception:
-            self._scheduled = False
-            self.flush()
+            # Widget destroyed; later writes flush directly.
+            self._pumping = False
 
     def flush(self):
         """Write the queued log lines into the text widget, trim old history, and scroll to the end.
@@ -916,7 +1285,6 @@ class GUILogger:
         the logger thread-safe enough for normal Tkinter usage patterns.
         """
         if not self._queue:
-            self._scheduled = False
             return
         try:
             self.widget.configure(state="normal")
@@ -926,18 +1294,17 @@ class GUILogger:
             try:
                 total_lines = int(self.widget.index("end-1c").split(".")[0])
                 if total_lines > self.max_lines:
-                    cut = total_lines - self.max_lines
+                    cut = total_lines - self.trim_to_lines
                     self.widget.delete("1.0", f"{cut+1}.0")
             except Exception:
                 pass
 
             self.widget.configure(state="disabled")
+            # No update_idletasks() here: the Tk loop redraws on its own once
+            # this callback returns, and forcing it per flush stalls bulk logging.
             self.widget.see("end")
-            self.widget.update_idletasks()
         except Exception:
             pass
-        finally:
-            self._scheduled = False
 # ------------------------------
 # Patch-type selector icons
 # ------------------------------